@@ -29,128 +29,14 @@ __author__ = 'Martin Prokš'
 __License__ = 'LGPL-2.1-or-later'
 __url__ = 'https://github.com/martinproks/cosmeticthread3d'
 
-import math
+import ct3d_catalog
 
-class MetricCoarse3th:
+class MetricCoarse3th(ct3d_catalog.MetricThreadCatalog):
     """
     class MetricCoarse3th
 
     Returns object (class) with threads parameters for Metric coarse thread
     3th selection (ISO 261 preffered group of threads).
-    """
-
-    def __init__(self):
-        self.__name = []
-        self.__D_nominal = []
-        self.__pitch = []
-        self.__D_drill = []
-
-        self.__name.append('M9')
-        self.__D_nominal.append(9)
-        self.__pitch.append(1.25)
-        self.__D_drill.append(7.65)
-
-        self.__name.append('M11')
-        self.__D_nominal.append(11)
-        self.__pitch.append(1.5)
-        self.__D_drill.append(9.4)
-
-    def getLstNames(self):
-        """
-        getLstNames() -> list of threads names
-        """
-        return self.__name
-
-    def getName(self, i):
-        """
-        getName(i) -> name
-
-        name = string or None
-        """
-        x = None
-        if i < len(self.__name):
-            x = self.__name[i]
-        return x
 
-    def getD_nominal(self, ThrName):
-        """
-        getD_nominal(ThrName) -> D_nominal
-        """
-        x = 0.0
-        i = 0
-        while i < len(self.__name):
-            if ThrName == self.__name[i]:
-                x = self.__D_nominal[i]
-                break
-            i += 1
-        return x
-
-    def getpitch(self, ThrName):
-        """
-        getpitch(ThrName) -> pitch
-        """
-        x = 0.0
-        i = 0
-        while i < len(self.__name):
-            if ThrName == self.__name[i]:
-                x = self.__pitch[i]
-                break
-            i += 1
-        return x
-
-    def getTPI(self, ThrName):
-        """
-        getTPI(ThrName) -> TPI
-        """
-        x = self.getpitch(ThrName)
-        x = round(25.4 / x, 3) if x > 0.0 else 0.0
-        return x
-
-    def getD(self, ThrName):
-        """
-        getD(ThrName) -> D
-        """
-        x = 0.0
-        i = 0
-        while i < len(self.__name):
-            if ThrName == self.__name[i]:
-                # in the case of metric thread coarse is D equal to D_nominal
-                x = self.__D_nominal[i]
-                break
-            i += 1
-        return x
-
-    def getD1(self, ThrName):
-        """
-        getD1(ThrName) -> D1
-        """
-        x = 0.0
-        Dtmp = self.getD(ThrName)
-        ptmp = self.getpitch(ThrName)
-        H = ptmp * 0.5 * math.sqrt(3)
-        x = round(Dtmp - 2*H*(5/8), 3)
-        return x
-
-    def getd3(self, ThrName):
-        """
-        getd3(ThrName) -> d3
-        """
-        x = 0.0
-        Dtmp = self.getD(ThrName)
-        ptmp = self.getpitch(ThrName)
-        H = ptmp * 0.5 * math.sqrt(3)
-        x = round(Dtmp - 2*H*(1 - (1/6) - (1/8)), 3)
-        return x
-    
-    def getD_drill(self, ThrName):
-        """
-        getD_drill(ThrName) -> D_drill
-        """
-        x = 0.0
-        i = 0
-        while i < len(self.__name):
-            if ThrName == self.__name[i]:
-                x = self.__D_drill[i]
-                break
-            i += 1
-        return x
+    The table itself is in catalogs/threads.csv (family 'MetricCoarse3th').
+    """
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_bench.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Micro-benchmarks of the thread catalog layer, runnable without FreeCAD.
+
+    python benchmarks/ct3d_bench.py                  # run, compare with baseline.json
+    python benchmarks/ct3d_bench.py --json out.json  # results to a file too
+    python benchmarks/ct3d_bench.py --save-baseline  # store results as the baseline
+    python benchmarks/ct3d_bench.py --filter UNC     # benchmarks containing 'UNC'
+
+For every catalog class it measures construction, getters, best fitting
+thread by diameter (threadIFromDobj) and parameter filling (fillParamsI /
+fillParamsE into a stub parameters object), plus the cross catalog
+searches and creation of thread feature properties (ct3d_params) on
+a stub document object. Results are in nanoseconds per operation, the best of several
+repeats. A result slower than baseline * tolerance is a regression and
+the exit code is 1.
+
+Memory held by the catalog layer (ct3d_catalog.getMemoryUsage() with
+all families, the merged index and the batch table built) is checked
+against MEMORY_CEILING too - about 406 kB today, the ceiling is 512 kB.
+Above the ceiling the exit code is 1 as well.
+
+The baseline is machine dependent - store it again on the machine that
+runs the comparison.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+
+# the workbench directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ct3d_catalog
+import ct3d_designation
+import ct3d_params
+import ct3d_tools
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# bytes, ct3d_catalog.getMemoryUsage()['total'] of the built-in catalogs
+MEMORY_CEILING = 512 * 1024
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Stubs                                                  |
+# |                                                        |
+# +--------------------------------------------------------+
+class StubParams:
+    """
+    Stand-in for ct3di_params_class / ct3de_params_class - plain
+    attributes, no FreeCAD.
+    """
+
+class StubInternal:
+    """
+    Internal thread feature for threadIFromDobj() - it has D1.
+    """
+    D1 = 0.0
+
+class StubExternal:
+    """
+    External thread feature for threadIFromDobj() - it has d3.
+    """
+    d3 = 0.0
+
+
+
+class StubQuantity(float):
+    """
+    Value of App::PropertyLength - float with .Value.
+    """
+
+    @property
+    def Value(self):
+        return float(self)
+
+class StubFeature:
+    """
+    Stand-in for a FreeCAD document object. Properties are attributes,
+    every change calls onChanged() of the Proxy like FreeCAD does.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, 'Proxy', None)
+        object.__setattr__(self, 'changes', 0)
+
+    def addProperty(self, ptype, name, group='', doc='', mode=0):
+        value = StubQuantity(0.0) if ptype == 'App::PropertyLength' else ''
+        object.__setattr__(self, name, value)
+        self._changed(name)
+        return self
+
+    def __setattr__(self, name, value):
+        if isinstance(getattr(self, name, None), StubQuantity):
+            value = StubQuantity(value)
+        object.__setattr__(self, name, value)
+        self._changed(name)
+
+    def _changed(self, name):
+        object.__setattr__(self, 'changes', self.changes + 1)
+        if self.Proxy is not None:
+            self.Proxy.onChanged(self, name)
+
+class StubProxy:
+    """
+    Feature proxy with onChanged() - as the thread features.
+    """
+
+    def onChanged(self, obj, prop):
+        pass
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Timing                                                 |
+# |                                                        |
+# +--------------------------------------------------------+
+def measure(func, ops, repeat=5, min_time=0.05):
+    """
+    measure(func, ops, repeat=5, min_time=0.05) -> ns per operation
+
+    func() does ops operations. It is called in loops of at least
+    min_time seconds, the best of repeat loops is returned.
+    """
+    loops = 1
+    while True:
+        t = time.perf_counter()
+        for i in range(loops):
+            func()
+        dt = time.perf_counter() - t
+        if dt >= min_time:
+            break
+        loops *= 2
+    best = dt
+    for k in range(repeat - 1):
+        t = time.perf_counter()
+        for i in range(loops):
+            func()
+        best = min(best, time.perf_counter() - t)
+    return 1e9 * best / (loops * ops)
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Benchmarks                                             |
+# |                                                        |
+# +--------------------------------------------------------+
+def _familyBenchmarks(family):
+    """
+    _familyBenchmarks(family) -> list of (name, func, ops)
+    """
+    lthr = ct3d_catalog.getCatalog(family)
+    names = list(lthr.getLstNames())
+    n = max(len(names), 1)
+    try:
+        cls = getattr(importlib.import_module(family), family)
+    except ImportError:
+        cls = None # user family - no module
+    benchmarks = []
+    if cls is not None:
+        # fresh instance, not the shared one from getCatalog()
+        benchmarks.append(('construct.' + family, cls, 1))
+
+    def getters():
+        for name in names:
+            lthr.getD_nominal(name)
+            lthr.getD(name)
+            lthr.getD1(name)
+            lthr.getd3(name)
+            lthr.getpitch(name)
+            lthr.getTPI(name)
+            lthr.getD_drill(name)
+    benchmarks.append(('getters.' + family, getters, 7 * n))
+
+    # diameters over the whole range of the catalog
+    top = 1.2 * max([lthr.getD(x) for x in names] + [1.0])
+    sweep = [top * (i + 1) / 200.0 for i in range(200)]
+    internal = StubInternal()
+    external = StubExternal()
+
+    def nearest():
+        for Dobj in sweep:
+            ct3d_tools.threadIFromDobj(Dobj, internal, lthr)
+            ct3d_tools.threadIFromDobj(Dobj, external, lthr)
+    benchmarks.append(('threadIFromDobj.' + family, nearest, 2 * len(sweep)))
+
+    prms = StubParams()
+
+    def fill():
+        for name in names:
+            ct3d_tools.fillParamsI(prms, name, lthr)
+            ct3d_tools.fillParamsE(prms, name, lthr)
+    benchmarks.append(('fillParams.' + family, fill, 2 * n))
+    return benchmarks
+
+def getBenchmarks():
+    """
+    getBenchmarks() -> list of (name, func, ops)
+    """
+    benchmarks = []
+    for family, title in ct3d_catalog.getFamilies():
+        benchmarks.extend(_familyBenchmarks(family))
+    sweep = [0.25 * (i + 1) for i in range(400)]
+
+    def bestFit():
+        for Dobj in sweep:
+            ct3d_catalog.findBestFit(Dobj, True)
+            ct3d_catalog.findBestFit(Dobj, False)
+    benchmarks.append(('findBestFit', bestFit, 2 * len(sweep)))
+
+    texts = ['M10', 'm10x1.25', '1/4-20UNC', '#10-24 UNC', 'BSW 1/2"', 'G1/2',
+             'M12x1.5-6g', 'foo']
+
+    def designation():
+        ct3d_designation._resolve.cache_clear()
+        for text in texts:
+            try:
+                ct3d_designation.parseDesignation(text)
+            except ct3d_designation.DesignationError:
+                pass
+    benchmarks.append(('parseDesignation.cold', designation, len(texts)))
+
+    prmsI = ct3d_params.ct3di_params_class()
+    prmsE = ct3d_params.ct3de_params_class()
+
+    def createInternal():
+        obj = StubFeature()
+        ct3d_params.addProperty_internal_thread(obj, prmsI)
+        obj.Proxy = StubProxy()
+    benchmarks.append(('createProperties.internal', createInternal, 1))
+
+    def createExternal():
+        obj = StubFeature()
+        ct3d_params.addProperty_external_thread(obj, prmsE)
+        obj.Proxy = StubProxy()
+    benchmarks.append(('createProperties.external', createExternal, 1))
+
+    names = [x.name for x in ct3d_catalog._getMergedIndex()['records']]
+
+    def batch():
+        ct3d_catalog.evaluateBatch(names)
+    benchmarks.append(('evaluateBatch', batch, len(names)))
+    return benchmarks
+
+def run(pattern=None):
+    """
+    run(pattern=None) -> dictionary benchmark name -> ns per operation
+    """
+    rslt = {}
+    for name, func, ops in getBenchmarks():
+        if (pattern is None) or (pattern in name):
+            rslt[name] = round(measure(func, ops), 1)
+    return rslt
+
+def memoryUsage():
+    """
+    memoryUsage() -> bytes held by the catalog layer
+
+    All families, the merged index and the batch table are built first,
+    so the result does not depend on the benchmarks run before.
+    """
+    for family, title in ct3d_catalog.getFamilies():
+        ct3d_catalog.getCatalog(family)
+    ct3d_catalog.findRecord('M10')
+    ct3d_catalog.evaluateBatch(['M10'])
+    return ct3d_catalog.getMemoryUsage()['total']
+
+def compare(results, baseline, tolerance):
+    """
+    compare(results, baseline, tolerance) -> list of (name, ns, baseline ns)
+
+    Benchmarks slower than baseline * tolerance.
+    """
+    slow = []
+    for name, ns in sorted(results.items()):
+        ref = baseline.get(name)
+        if (ref is not None) and (ns > ref * tolerance):
+            slow.append((name, ns, ref))
+    return slow
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | main()                                                 |
+# |                                                        |
+# +--------------------------------------------------------+
+def main(argv=None):
+    """
+    main(argv=None) -> exit code (0 ok, 1 regression)
+    """
+    parser = argparse.ArgumentParser(description='Cosmetic Thread 3D catalog benchmarks.')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file')
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help='allowed slowdown factor (default 1.5)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store results as the baseline')
+    parser.add_argument('--filter', help='run benchmarks containing this text only')
+    args = parser.parse_args(argv)
+
+    results = run(args.filter)
+    report = {'python': platform.python_version(),
+              'machine': platform.machine(),
+              'unit': 'ns/op',
+              'results': results}
+    for name, ns in sorted(results.items()):
+        print('%-36s %12.1f ns/op' % (name, ns))
+    memory = memoryUsage()
+    print('%-36s %12.1f kB (ceiling %.1f kB)' % ('memory', memory / 1024.0,
+                                                 MEMORY_CEILING / 1024.0))
+    tooBig = memory > MEMORY_CEILING
+    if tooBig:
+        print('REGRESSION memory: %d bytes, ceiling %d bytes' % (memory, MEMORY_CEILING))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+            f.write('\n')
+        return 0
+    if not os.path.isfile(args.baseline):
+        print('No baseline %s' % args.baseline)
+        return 1 if tooBig else 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        stored = json.load(f)
+    baseline = stored['results']
+    if (stored.get('python'), stored.get('machine')) != (report['python'], report['machine']):
+        print('Baseline is from python %s / %s, compare with care' % \
+              (stored.get('python'), stored.get('machine')))
+    slow = compare(results, baseline, args.tolerance)
+    for name, ns, ref in slow:
+        print('REGRESSION %s: %.1f ns/op, baseline %.1f ns/op' % (name, ns, ref))
+    return 1 if (slow or tooBig) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
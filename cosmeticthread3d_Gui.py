@@ -36,7 +36,7 @@ from AttachmentEditor import Commands
 import ct3d_params
 import cosmeticthread3d_part as ct3d_p
 import cosmeticthread3d_partdesign as ct3d_pd
-import MetricCoarse1st
+import ct3d_catalog
 import ct3dGuiTools
 
 __title__ = 'Cosmetic Thread 3D Work Bench'
@@ -128,7 +128,7 @@ class ct3di_p_menu_command():
         Reaction to editAttachment - OK has been pressed, go on with
         UI Thread Creation.
         """
-        lst_threads = MetricCoarse1st.MetricCoarse1st()
+        lst_threads = ct3d_catalog.getCatalog('MetricCoarse1st')
         ct3d_prms = ct3d_params.ct3di_params_class()
         D_hole = ct3dGuiTools.diameter_from_attachment(self.obj_tmp)
         ct3dGuiTools.fillParamsI(ct3d_prms,
@@ -240,7 +240,7 @@ class ct3de_p_menu_command():
         Reaction to editAttachment - OK has been pressed, go on with
         UI Thread Creation.
         """
-        lst_threads = MetricCoarse1st.MetricCoarse1st()
+        lst_threads = ct3d_catalog.getCatalog('MetricCoarse1st')
         ct3d_prms = ct3d_params.ct3de_params_class()
         D_shaft = ct3dGuiTools.diameter_from_attachment(self.obj_tmp)
         ct3dGuiTools.fillParamsE(ct3d_prms,
@@ -359,7 +359,7 @@ class ct3di_pd_menu_command():
         Reaction to editAttachment - OK has been pressed, go on with
         UI Thread Creation.
         """
-        lst_threads = MetricCoarse1st.MetricCoarse1st()
+        lst_threads = ct3d_catalog.getCatalog('MetricCoarse1st')
         ct3d_prms = ct3d_params.ct3di_params_class()
         D_hole = ct3dGuiTools.diameter_from_attachment(self.obj_tmp)
         ct3dGuiTools.fillParamsI(ct3d_prms,
@@ -478,7 +478,7 @@ class ct3de_pd_menu_command():
         Reaction to editAttachment - OK has been pressed, go on with UI
         Thread Creation.
         """
-        lst_threads = MetricCoarse1st.MetricCoarse1st()
+        lst_threads = ct3d_catalog.getCatalog('MetricCoarse1st')
         ct3d_prms = ct3d_params.ct3de_params_class()
         D_shaft = ct3dGuiTools.diameter_from_attachment(self.obj_tmp)
         ct3dGuiTools.fillParamsE(ct3d_prms,
@@ -30,8 +30,9 @@ Definition of PythonFeature for each Part version of thread geometry type.
 import os # needed just for _p4 threads
 from pivy import coin # needed just for _p4 threads
 import FreeCAD as App
-import Part
+import ct3d_geometry
 import ct3d_params
+import ct3d_view
 
 ___title__ = 'Cosmetic Thread 3D Work Bench'
 __author__ = 'Martin Prokš'
@@ -72,24 +73,33 @@ class ViewProvider_ct3di:
         obj.PointColor = (25, 25, 25)
         obj.PointSize = 1.0
         obj.Transparency = 0
+        # display mode of the complete feature
+        self.updateData(obj.Object, 'lightweight')
 
     def attach(self, obj):
         """
         Setup the scene sub-graph of the view provider, this method
         is mandatory.
         """
+        self.lines = ct3d_view.ThreadLines(obj, True)
+        # loads() may come first
+        self.lines.loads(getattr(self, 'linesState', None))
 
     def updateData(self, fp, prop):
         """
         If a property of the handled feature has changed we have the chance
         to handle this here.
         """
+        # updateData() may come before attach() (document restore)
+        lines = getattr(self, 'lines', None)
+        if lines is not None:
+            lines.updateData(fp, prop)
 
     def getDisplayModes(self, obj):
         """
         Return a list of display modes.
         """
-        return []
+        return [ct3d_view.LIGHTWEIGHT]
 
     def getDefaultDisplayMode(self):
         """
@@ -109,8 +119,10 @@ class ViewProvider_ct3di:
 
     def onChanged(self, vp, prop):
         """
-        Print the name of the property that has changed
+        Line style of the lightweight display follows the view properties.
         """
+        if (prop in ('LineColor', 'LineWidth', 'DrawStyle')) and hasattr(self, 'lines'):
+            self.lines.setStyle(vp)
 
     def getIcon(self):
         """
@@ -145,13 +157,32 @@ class ViewProvider_ct3di:
 
     def dumps(self):
         """
-        Called during document saving.
+        Called during document saving. The display mode used before
+        the lightweight one is saved.
         """
+        lines = getattr(self, 'lines', None)
+        return None if lines is None else lines.dumps()
 
     def loads(self, state):
         """
         Called during document restore.
         """
+        self.linesState = state
+        lines = getattr(self, 'lines', None)
+        if lines is not None:
+            lines.loads(state)
+
+    def __getstate__(self):
+        """
+        Older FreeCAD versions call __getstate__() instead of dumps().
+        """
+        return self.dumps()
+
+    def __setstate__(self, state):
+        """
+        Older FreeCAD versions call __setstate__() instead of loads().
+        """
+        self.loads(state)
 
 # +------------------------------------------------------------+
 # | internal() - create internal thread object and geometry    |
@@ -182,8 +213,10 @@ def internal(name, ct3di_prms, doc, aPart):
         obj = doc.addObject('Part::Part2DObjectPython', name)
         if aPart is not None:
             aPart.addObject(obj)
-        ViewProvider_ct3di(obj.ViewObject)
+        # the feature first - the view provider is attached to complete
+        # properties, no updateData() for each of them
         CosmeticThread3DInternal(obj, ct3di_prms)
+        ViewProvider_ct3di(obj.ViewObject)
         App.ActiveDocument.recompute()
     doc.commitTransaction()
     return obj
@@ -210,47 +243,105 @@ class CosmeticThread3DInternal:
         """
         #
         self.Type = 'CosmeticThread3DInternalPart'
+        # properties changed since the last recompute, None - all
+        self.changed = None
+        # parameters of obj.Shape, see ct3d_geometry.internalShapeKey()
+        self.shapeKey = None
+        # onChanged() ignores notifications while the properties are
+        # created or restored, see loads() and onDocumentRestored().
+        # The Proxy is set first, so onChanged() sees the flag.
+        self._loading = True
         obj.Proxy = self
         # Add property of internal thread into obj
         ct3d_params.addProperty_internal_thread(obj, ct3di_prms)
+        self._loading = False
 
     def onChanged(self, obj, prop):
         """
-        Do something when a property has changed
+        Remember changed properties - execute() rebuilds the geometry
+        only if some of them needs it.
         """
+        if self._loading:
+            return
+        if self.changed is not None:
+            self.changed.add(prop)
 
     def execute(self, obj):
         """
         Do something when doing a recomputation, this method is mandatory
         """
-        ct3dGeo = []
-        # helix
-        tmp = Part.makeHelix(obj.pitch.Value,
-                             obj.length.Value,
-                             0.5*obj.D1.Value)
-        ct3dGeo.append(tmp)
-        # Major diameter at z=0
-        tmp = Part.makeCircle(0.5*obj.D.Value)
-        ct3dGeo.append(tmp)
-        # Major diameter at z = Thread Length
-        tmp = Part.makeCircle(0.5*obj.D.Value)
-        tmp.Placement.translate(App.Vector(0, 0, obj.length.Value))
-        ct3dGeo.append(tmp)
-        if not obj.length_through:
-            # Minor diameter at z = obj.length
-            tmp = Part.makeCircle(0.5*obj.D1.Value)
-            tmp.Placement.translate(App.Vector(0, 0, obj.length.Value))
-            ct3dGeo.append(tmp)
-        # resulting geometry
-        rslt = Part.makeCompound(ct3dGeo)
+        # Limit diameters by tolerance, stock drill
+        ct3d_params.updateLimits_internal_thread(obj)
+        ct3d_params.updateDrill_internal_thread(obj)
+        update = ct3d_params.geometryUpdate(self.changed)
         #
         # Apply attachement to the obj
         if not hasattr(obj, "positionBySupport"):
             self.makeAttachable(obj)
         obj.positionBySupport()
 
-        rslt.Placement = obj.Placement
-        obj.Shape = rslt
+        if (update is None) and not obj.Shape.isNull():
+            # thread data changed only - obj.Shape is not touched, no
+            # redraw; Part::Feature keeps it at obj.Placement
+            self.changed = set()
+            return
+        rslt = None
+        if (update == 'Shape') or obj.Shape.isNull():
+            key = ct3d_geometry.internalShapeKey(obj)
+            if (key != self.shapeKey) or obj.Shape.isNull():
+                # shared shape of equal threads
+                rslt = ct3d_geometry.shapeOfKey(key)
+                self.shapeKey = key
+        # otherwise the shape is the same, Part::Feature moves it with
+        # obj.Placement - no new Shape, no redraw
+        if rslt is not None:
+            # the shared shape is not changed - obj.Shape gets its own
+            # copy placed by obj.Placement during recompute
+            obj.Shape = rslt
+        self.changed = set()
+
+    def onDocumentRestored(self, obj):
+        """
+        Document is loaded, the shape is restored with it. Properties
+        missing in older documents are added with default values.
+        """
+        if ct3d_params.applySchema(obj, 'i', ct3d_params.ct3di_params_class()):
+            ct3d_params.updateLimits_internal_thread(obj)
+            ct3d_params.updateDrill_internal_thread(obj)
+        self.changed = set()
+        self._loading = False
+        self.shapeKey = ct3d_geometry.internalShapeKey(obj)
+
+    def dumps(self):
+        """
+        Called during document saving. Changed properties are not saved.
+        """
+        return {'Type': self.Type}
+
+    def loads(self, state):
+        """
+        Called during document restore.
+        """
+        self.Type = 'CosmeticThread3DInternalPart'
+        if isinstance(state, dict):
+            self.Type = state.get('Type', self.Type)
+        self.changed = None
+        self.shapeKey = None
+        # properties are restored after the proxy, onChanged() waits
+        # for onDocumentRestored()
+        self._loading = True
+
+    def __getstate__(self):
+        """
+        Older FreeCAD versions call __getstate__() instead of dumps().
+        """
+        return self.dumps()
+
+    def __setstate__(self, state):
+        """
+        Older FreeCAD versions call __setstate__() instead of loads().
+        """
+        self.loads(state)
 
 
 
@@ -282,24 +373,33 @@ class ViewProvider_ct3de:
         obj.PointColor = (25, 25, 25)
         obj.PointSize = 1.0
         obj.Transparency = 0
+        # display mode of the complete feature
+        self.updateData(obj.Object, 'lightweight')
 
     def attach(self, obj):
         """
         Setup the scene sub-graph of the view provider, this method is
         mandatory
         """
+        self.lines = ct3d_view.ThreadLines(obj, False)
+        # loads() may come first
+        self.lines.loads(getattr(self, 'linesState', None))
 
     def updateData(self, fp, prop):
         """
         If a property of the handled feature has changed we have the chance
         to handle this here
         """
+        # updateData() may come before attach() (document restore)
+        lines = getattr(self, 'lines', None)
+        if lines is not None:
+            lines.updateData(fp, prop)
 
     def getDisplayModes(self, obj):
         """
         Return a list of display modes.
         """
-        return []
+        return [ct3d_view.LIGHTWEIGHT]
 
     def getDefaultDisplayMode(self):
         """
@@ -319,8 +419,10 @@ class ViewProvider_ct3de:
 
     def onChanged(self, vp, prop):
         """
-        Print the name of the property that has changed
+        Line style of the lightweight display follows the view properties.
         """
+        if (prop in ('LineColor', 'LineWidth', 'DrawStyle')) and hasattr(self, 'lines'):
+            self.lines.setStyle(vp)
 
     def getIcon(self):
         """
@@ -361,13 +463,32 @@ class ViewProvider_ct3de:
 
     def dumps(self):
         """
-        Called during document saving.
+        Called during document saving. The display mode used before
+        the lightweight one is saved.
         """
+        lines = getattr(self, 'lines', None)
+        return None if lines is None else lines.dumps()
 
     def loads(self, state):
         """
         Called during document restore.
         """
+        self.linesState = state
+        lines = getattr(self, 'lines', None)
+        if lines is not None:
+            lines.loads(state)
+
+    def __getstate__(self):
+        """
+        Older FreeCAD versions call __getstate__() instead of dumps().
+        """
+        return self.dumps()
+
+    def __setstate__(self, state):
+        """
+        Older FreeCAD versions call __setstate__() instead of loads().
+        """
+        self.loads(state)
 
 # +---------------------------------------------------------+
 # | external() - create external thread object and geometry |
@@ -399,8 +520,10 @@ def external(name, ct3de_prms, doc, aPart):
         obj = doc.addObject('Part::Part2DObjectPython', name)
         if aPart is not None:
             aPart.addObject(obj)
-        ViewProvider_ct3de(obj.ViewObject)
+        # the feature first - the view provider is attached to complete
+        # properties, no updateData() for each of them
         CosmeticThread3DExternal(obj, ct3de_prms)
+        ViewProvider_ct3de(obj.ViewObject)
         App.ActiveDocument.recompute()
     doc.commitTransaction()
     return obj
@@ -420,43 +543,100 @@ class CosmeticThread3DExternal:
         """
 
         self.Type = 'CosmeticThread3DExternalPart'
+        # properties changed since the last recompute, None - all
+        self.changed = None
+        # parameters of obj.Shape, see ct3d_geometry.externalShapeKey()
+        self.shapeKey = None
+        # onChanged() ignores notifications while the properties are
+        # created or restored, see loads() and onDocumentRestored().
+        # The Proxy is set first, so onChanged() sees the flag.
+        self._loading = True
         obj.Proxy = self
+        # Add property of external thread into obj
         ct3d_params.addProperty_external_thread(obj, ct3de_prms)
+        self._loading = False
 
     def onChanged(self, obj, prop):
         """
-        Do something when a property has changed
+        Remember changed properties - execute() rebuilds the geometry
+        only if some of them needs it.
         """
+        if self._loading:
+            return
+        if self.changed is not None:
+            self.changed.add(prop)
 
     def execute(self, obj):
         """
         Do something when doing a recomputation, this method is mandatory
         """
-        ct3dGeo = []
-        # helix
-        tmp = Part.makeHelix(obj.pitch.Value,
-                             obj.length.Value,
-                             0.5*obj.D.Value)
-        ct3dGeo.append(tmp)
-        # Minor diameter at z=0
-        tmp = Part.makeCircle(0.5*obj.d3.Value)
-        ct3dGeo.append(tmp)
-        # Minor diameter at z = Thread Length
-        tmp = Part.makeCircle(0.5*obj.d3.Value)
-        tmp.Placement.translate(App.Vector(0, 0, obj.length.Value))
-        ct3dGeo.append(tmp)
-        if not obj.length_through:
-            # Major diameter at z = obj.length
-            tmp = Part.makeCircle(0.5*obj.D.Value)
-            tmp.Placement.translate(App.Vector(0, 0, obj.length.Value))
-            ct3dGeo.append(tmp)
-        # resulting geometry
-        rslt = Part.makeCompound(ct3dGeo)
+        # Limit diameters by tolerance
+        ct3d_params.updateLimits_external_thread(obj)
+        update = ct3d_params.geometryUpdate(self.changed)
 
         # Apply attachement to the obj
         if not hasattr(obj, "positionBySupport"):
             self.makeAttachable(obj)
         obj.positionBySupport()
 
-        rslt.Placement = obj.Placement
-        obj.Shape = rslt
+        if (update is None) and not obj.Shape.isNull():
+            # thread data changed only - obj.Shape is not touched, no
+            # redraw; Part::Feature keeps it at obj.Placement
+            self.changed = set()
+            return
+        rslt = None
+        if (update == 'Shape') or obj.Shape.isNull():
+            key = ct3d_geometry.externalShapeKey(obj)
+            if (key != self.shapeKey) or obj.Shape.isNull():
+                # shared shape of equal threads
+                rslt = ct3d_geometry.shapeOfKey(key)
+                self.shapeKey = key
+        # otherwise the shape is the same, Part::Feature moves it with
+        # obj.Placement - no new Shape, no redraw
+        if rslt is not None:
+            # the shared shape is not changed - obj.Shape gets its own
+            # copy placed by obj.Placement during recompute
+            obj.Shape = rslt
+        self.changed = set()
+
+    def onDocumentRestored(self, obj):
+        """
+        Document is loaded, the shape is restored with it. Properties
+        missing in older documents are added with default values.
+        """
+        if ct3d_params.applySchema(obj, 'e', ct3d_params.ct3de_params_class()):
+            ct3d_params.updateLimits_external_thread(obj)
+        self.changed = set()
+        self._loading = False
+        self.shapeKey = ct3d_geometry.externalShapeKey(obj)
+
+    def dumps(self):
+        """
+        Called during document saving. Changed properties are not saved.
+        """
+        return {'Type': self.Type}
+
+    def loads(self, state):
+        """
+        Called during document restore.
+        """
+        self.Type = 'CosmeticThread3DExternalPart'
+        if isinstance(state, dict):
+            self.Type = state.get('Type', self.Type)
+        self.changed = None
+        self.shapeKey = None
+        # properties are restored after the proxy, onChanged() waits
+        # for onDocumentRestored()
+        self._loading = True
+
+    def __getstate__(self):
+        """
+        Older FreeCAD versions call __getstate__() instead of dumps().
+        """
+        return self.dumps()
+
+    def __setstate__(self, state):
+        """
+        Older FreeCAD versions call __setstate__() instead of loads().
+        """
+        self.loads(state)
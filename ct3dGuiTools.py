@@ -37,19 +37,9 @@ import FreeCAD as App
 import Part
 import Draft
 
-import MetricCoarse1st
-import MetricCoarse2nd
-import MetricCoarse3th
-import MetricFine1st
-import MetricFine2nd
-import MetricFine3th
-import MetricEle
-import Gthread
-import UNC
-import UNF
-import UNEF
-import BSW
-import BSF
+import ct3d_catalog
+# FreeCAD independent tools, kept importable from here
+from ct3d_tools import threadIFromDobj, fillParamsI, fillParamsE
 
 __title__ = 'Cosmetic Thread 3D Work Bench'
 __author__ = 'Martin Prokš'
@@ -117,36 +107,16 @@ class ct3d_threadUI(QtGui.QDialog):
         # accessible from other methods
         self.__obj = obj
         self.__Dobj = Dobj
-        # Thread type initialization
-        self.__tOT = [] # typesOfThreads
-        self.__tOT.append('Metric Coarse thread')
-        # MetricCoarse1st.MetricCoarse1st()
-        self.__tOT.append('Metric Coarse thread 2nd choice')
-        # MetricCoarse2nd.MetricCoarse2nd()
-        self.__tOT.append('Metric Coarse thread 3th choice')
-        # MetricCoarse3th.MetricCoarse3th()
-        self.__tOT.append('Metric Fine thread')
-        # MetricFine.MetricFine()
-        self.__tOT.append('Metric Fine thread 2nd choice')
-        # MetricFine2nd.MetricFine2nd()
-        self.__tOT.append('Metric Fine thread 3th choice')
-        # MetricFine3th.MetricFine3th()
-        self.__tOT.append('Metric Electrical thread')
-        # MetricEle.MetricEle() # according to EN 60423 selection
-        self.__tOT.append('G - Pipe Parallel Thread (BSPP)')
-        # Gthread.Gthread()
-        self.__tOT.append('UNC - Unified Thread Standard Coarse')
-        # UNC.UNC()
-        self.__tOT.append('UNF - Unified Thread Standard Fine')
-        # UNF.UNF()
-        self.__tOT.append('UNEF - Unified Thread Standard Extra fine')
-        # UNEF.UNEF()
-        self.__tOT.append('BSW - British Standard Whitworth')
-        # BSW.BSW()
-        self.__tOT.append('BSF - British Standard Fine')
-        # BSF.BSF()
+        # User catalogs are parsed again only if they were changed
+        if ct3d_catalog.refreshUserCatalogs():
+            for msg in ct3d_catalog.getUserCatalogErrors():
+                App.Console.PrintWarning('User thread catalog: ' + msg + '\n')
+        # Thread type initialization - typesOfThreads, see
+        # ct3d_catalog.getFamilies()
+        self.__families = ct3d_catalog.getFamilies()
+        self.__tOT = [title for family, title in self.__families]
         self.__tOT_index = 0
-        self.__lthr = MetricCoarse1st.MetricCoarse1st()
+        self.__lthr = ct3d_catalog.getCatalog(self.__families[0][0])
         self.__lthr_index = 0
         # Use group Threads? This value is not internal.
         self.useGroup = True
@@ -400,60 +370,38 @@ class ct3d_threadUI(QtGui.QDialog):
 
     def onPopupTypeOfThread(self, selectedText):
         self.__tOT_index = self.w_tOT.currentIndex()
-        tOT_name = self.__tOT[self.__tOT_index]
-
-        if tOT_name == 'Metric Coarse thread':
-            self.__lthr = MetricCoarse1st.MetricCoarse1st()
-        elif tOT_name == 'Metric Coarse thread 2nd choice':
-            self.__lthr = MetricCoarse2nd.MetricCoarse2nd()
-        elif tOT_name == 'Metric Coarse thread 3th choice':
-            self.__lthr = MetricCoarse3th.MetricCoarse3th()
-        elif tOT_name == 'Metric Fine thread':
-            self.__lthr = MetricFine1st.MetricFine1st()
-        elif tOT_name == 'Metric Fine thread 2nd choice':
-            self.__lthr = MetricFine2nd.MetricFine2nd()
-        elif tOT_name == 'Metric Fine thread 3th choice':
-            self.__lthr = MetricFine3th.MetricFine3th()
-        elif tOT_name == 'Metric Electrical thread':
-            self.__lthr = MetricEle.MetricEle()
-        elif tOT_name == 'G - Pipe Parallel Thread (BSPP)':
-            self.__lthr = Gthread.Gthread()
-        elif tOT_name == 'UNC - Unified Thread Standard Coarse':
-            self.__lthr = UNC.UNC()
-        elif tOT_name == 'UNF - Unified Thread Standard Fine':
-            self.__lthr = UNF.UNF()
-        elif tOT_name == 'UNEF - Unified Thread Standard Extra fine':
-            self.__lthr = UNEF.UNEF()
-        elif tOT_name == 'BSW - British Standard Whitworth':
-            self.__lthr = BSW.BSW()
-        elif tOT_name == 'BSF - British Standard Fine':
-            self.__lthr = BSF.BSF()
+        if 0 <= self.__tOT_index < len(self.__families):
+            # catalogs are shared and created just once per session
+            family = self.__families[self.__tOT_index][0]
+            self.__lthr = ct3d_catalog.getCatalog(family)
         else:
             App.Console.PrintMessage('*** FIXME *** ct3dGouiTools.ct3d_threadUI.onPopupTypeOfThread() - selected thread type is not implemented\n')
             self.__tOT_index = 0
             self.w_tOT.setCurrentIndex(self.__tOT_index)
-            self.__lthr = MetricCoarse1st.MetricCoarse1st()
+            self.__lthr = ct3d_catalog.getCatalog(self.__families[0][0])
         self.w_lthr.clear()
         self.w_lthr.addItems(self.__lthr.getLstNames())
         i = threadIFromDobj(self.__Dobj, self.__obj, self.__lthr)
         self.w_lthr.setCurrentIndex(i)
         self.onPopupThreadSel(self.__lthr.getName(i))
         self.onApply()
-        del i, tOT_name
+        del i
 
     def onPopupThreadSel(self, selectedText):
         # user selected some thread type, fill widgets by self.__lthr values
         self.__lthr_index = self.w_lthr.currentIndex()
-        name = self.__lthr.getName(self.__lthr_index)
-        self.w_D_nom.setText(str(self.__lthr.getD_nominal(name)))
-        self.w_pitch.setText(str(self.__lthr.getpitch(name)))
-        self.w_TPI.setText(str(self.__lthr.getTPI(name)))
-        self.w_D.setText(str(self.__lthr.getD(name)))
-        self.w_D1.setText(str(self.__lthr.getD1(name)))
-        self.w_d3.setText(str(self.__lthr.getd3(name)))
-        self.w_D_drill.setText(str(self.__lthr.getD_drill(name)))
+        rec = self.__lthr.getRecordByIndex(self.__lthr_index)
+        if rec is None:
+            rec = ct3d_catalog.NO_RECORD
+        self.w_D_nom.setText(str(rec.D_nominal))
+        self.w_pitch.setText(str(rec.pitch))
+        self.w_TPI.setText(str(rec.TPI))
+        self.w_D.setText(str(rec.D))
+        self.w_D1.setText(str(rec.D1))
+        self.w_d3.setText(str(rec.d3))
+        self.w_D_drill.setText(str(rec.D_drill))
         # Rest of the values are independent on thread selection
-        del name
+        del rec
 
     def onApply(self):
         self.__obj.Label2 = self.w_lthr.currentText()
@@ -690,61 +638,6 @@ def diameter_from_attachment(obj):
 
 
 
-# /***********************************************************************/
-# /                                                                       /
-# / threadIFromDobj() - Estimate best fitting thread name/counter 'i'     /
-# /     from Dobj and list of threads                                     /
-# /                                                                       /
-# /***********************************************************************/
-def threadIFromDobj(Dobj, obj, lthr):
-    """
-    threadIFromDobj(Dobj, obj, list_of_thread_class) -> int
-
-    Estimate the best fitting thread index from Dobj and list_of_thread_class.
-    Returns int >= 0
-    """
-    CurrentIndex = 0
-    n = len(lthr.getLstNames())
-    if hasattr(obj, 'D1'):  # internal thread
-        i = 0
-        Ddrill = lthr.getD_drill(lthr.getName(i))
-        # deviance is relative value based on D_drill
-        deviance = abs(Ddrill - Dobj) / Ddrill
-        while i < n-1:
-            Ddrill = lthr.getD_drill(lthr.getName(i+1))
-             # deviance_next is relative value based on D_drill
-            deviance_next = abs(Ddrill - Dobj) / Ddrill
-            if deviance > deviance_next:
-                # while the deviance is descending (deviance > deviance_next),
-                # [i+1] is matching better than [i].
-                CurrentIndex = i+1
-            else:  # STOP, the [i] matched better than [i+1]
-                i = n-2 # this will force to stop
-            i += 1 # move i for nex turn...
-            deviance = deviance_next # and actualize appropriate deviance
-        del Ddrill
-    if hasattr(obj, 'd3'):  # external thread
-        i = 0
-        Dtmp = lthr.getD(lthr.getName(i))
-        deviance = abs(Dtmp - Dobj) / Dtmp # relative value based on D
-        while i < n-1:
-            Dtmp = lthr.getD(lthr.getName(i+1))
-             # deviance_next is relative value based on D
-            deviance_next = abs(Dtmp - Dobj) / Dtmp
-            if deviance > deviance_next:
-                # while the deviance is descending, [i+1] is matching
-                # better than [i].
-                CurrentIndex = i+1
-            else:  # STOP, the [i] matched better than [i+1]
-                i = n-2 # this will force to stop
-            i += 1 # move i for nex turn...
-            deviance = deviance_next # and actualize appropriate deviance
-        del Dtmp
-    del n, i, deviance, deviance_next
-    return CurrentIndex
-
-
-
 # /***********************************************************************/
 # /                                                                       /
 # / useGroupThreads() - Move object obj into Threads group/folder in      /
@@ -796,62 +689,3 @@ def useGroupThreads(obj, aPart):
         aPart.removeObject(obj)
 
     groupObj.addObject(obj) # Move object obj into the group 'Threads'
-
-
-
-# /***********************************************************************/
-# /                                                                       /
-# / fillParamsI()                                                         /
-# /                                                                       /
-# /***********************************************************************/
-def fillParamsI (ct3d_prms, thrName, lst_threads):
-    """
-    fillParamsI (ct3d_prms, thrName, lst_threads) -> None
-
-    Fill ct3d params from lst_threads according to thrName.
-    Internal thread version.
-    """
-    ct3d_prms.name = thrName
-    ct3d_prms.D_nominal = lst_threads.getD_nominal(thrName)
-    ct3d_prms.pitch = lst_threads.getpitch(thrName)
-    ct3d_prms.TPI = lst_threads.getTPI(thrName)
-    ct3d_prms.D = lst_threads.getD(thrName)
-    ct3d_prms.D1 = lst_threads.getD1(thrName)
-    # ct3d_prms.d3 = lst_threads.getd3(thrName) # internal thread
-    # # doesn't have this parameter
-    ct3d_prms.D_drill = lst_threads.getD_drill(thrName)
-    ct3d_prms.tolerance = '6H'
-    ct3d_prms.roughness = 'Ra 1.6'
-    ct3d_prms.length = round(1.5 * ct3d_prms.D_nominal, 1)
-    ct3d_prms.length_through = False
-    ct3d_prms.length_tol = "H17"
-
-
-
-# /***********************************************************************/
-# /                                                                       /
-# / fillParamsE()                                                         /
-# /                                                                       /
-# /***********************************************************************/
-def fillParamsE (ct3d_prms, thrName, lst_threads):
-    """
-    fillParamsE (ct3d_prms, thrName, lst_threads) -> None
-
-    Fill ct3d params from lst_threads according to thrName.
-    External thread version.
-    """
-    ct3d_prms.name = thrName
-    ct3d_prms.D_nominal = lst_threads.getD_nominal(thrName)
-    ct3d_prms.pitch = lst_threads.getpitch(thrName)
-    ct3d_prms.TPI = lst_threads.getTPI(thrName)
-    ct3d_prms.D = lst_threads.getD(thrName)
-    # ct3d_prms.D1 = lst_threads.getD1(thrName) # external thread
-    # # doesn't have this parameter
-    ct3d_prms.d3 = lst_threads.getd3(thrName)
-    # ct3d_prms.D_drill = lst_threads.getD_drill(thrName) # external thread
-    # # doesn't have this parameter
-    ct3d_prms.tolerance = '6g'
-    ct3d_prms.roughness = 'Ra 1.6'
-    ct3d_prms.length = round(1.5 * ct3d_prms.D_nominal, 1)
-    ct3d_prms.length_through = False
-    ct3d_prms.length_tol = "H17"
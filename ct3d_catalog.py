@@ -0,0 +1,1273 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_catalog.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Common base of all thread catalogs (MetricCoarse1st, UNC, BSW, ...).
+
+Every catalog keeps parallel lists of thread parameters. The lists are
+indexed by thread name once, when the catalog is filled, so every getter
+is a dictionary lookup instead of a scan through the whole table.
+Derived dimensions (pitch or TPI, D1, d3) are computed for the whole table
+at the same moment, the getters just read stored values. Sorted D and
+D_drill indexes are kept for the nearest thread search by diameter.
+
+Catalog objects are read only after they are filled, so one instance
+of each family is shared by the whole FreeCAD session - see getCatalog().
+
+The tables themselves are stored in catalogs/threads.csv. The file is
+parsed once and kept in a compiled cache (marshal format, in a private
+cache directory of the user) that is rebuilt only when the csv file
+changes - see getTables() and _cacheDir(). The cache
+saves the csv parsing at the first load of the tables only, the catalogs
+are still built from the loaded rows.
+
+User catalogs - csv files of the same format in the user catalog directory
+(see userCatalogDir()) - are merged into the built-in families or create
+new ones. They are parsed again only if their modification time or size
+changed - see refreshUserCatalogs().
+
+findByPitch() and findByTPI() return threads of all families with
+a given (measured) pitch or TPI.
+
+evaluateBatch() returns parameters of many threads at once as contiguous
+arrays - numpy arrays if numpy is available, array.array('d') otherwise.
+
+Getters accept variants of the names too ('m10', 'M10x1.5', '1/4-20UNC',
+'0.25-20 UNC', '1-1/2"-6 UNC') - see normalizeName() and the alias index
+of every catalog. findRecord() looks a name up in all families.
+
+Records are immutable tuples sharing equal values, indexes are array
+columns. getMemoryUsage() reports the memory held by this module.
+
+This module does not import FreeCAD. It can be used from plain python.
+"""
+
+import array
+import bisect
+import collections
+import csv
+import importlib
+import marshal
+import math
+import os
+import re
+import sys
+import tempfile
+import zlib
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Thread families - (module and class name, UI title)    |
+# |                                                        |
+# +--------------------------------------------------------+
+FAMILIES = (
+    ('MetricCoarse1st', 'Metric Coarse thread'),
+    ('MetricCoarse2nd', 'Metric Coarse thread 2nd choice'),
+    ('MetricCoarse3th', 'Metric Coarse thread 3th choice'),
+    ('MetricFine1st', 'Metric Fine thread'),
+    ('MetricFine2nd', 'Metric Fine thread 2nd choice'),
+    ('MetricFine3th', 'Metric Fine thread 3th choice'),
+    ('MetricEle', 'Metric Electrical thread'), # according to EN 60423
+    ('Gthread', 'G - Pipe Parallel Thread (BSPP)'),
+    ('UNC', 'UNC - Unified Thread Standard Coarse'),
+    ('UNF', 'UNF - Unified Thread Standard Fine'),
+    ('UNEF', 'UNEF - Unified Thread Standard Extra fine'),
+    ('BSW', 'BSW - British Standard Whitworth'),
+    ('BSF', 'BSF - British Standard Fine'),
+)
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | ThreadRecord - all parameters of one catalog entry     |
+# |                                                        |
+# +--------------------------------------------------------+
+# Immutable record returned by getRecord() / getRecordByIndex().
+# namedtuple has no per instance dictionary (__slots__ = ()), it costs
+# the same as a plain tuple.
+ThreadRecord = collections.namedtuple('ThreadRecord',
+                                      ['name',      # [string] designation
+                                       'family',    # [string] e.g. 'UNC'
+                                       'D_nominal', # [mm]
+                                       'pitch',     # [mm]
+                                       'TPI',       # [-] threads per inch
+                                       'D',         # [mm] major diameter
+                                       'D1',        # [mm] minor dia. internal
+                                       'd3',        # [mm] minor dia. external
+                                       'D_drill'])  # [mm] pre-drilled hole
+
+# Record with zero values - the same values the getters return for
+# an unknown thread name.
+NO_RECORD = ThreadRecord('', '', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+# Process-wide cache of catalog instances, family -> catalog object.
+# Filled lazily by getCatalog().
+_catalogs = {}
+
+# Built-in thread tables (csv source of the compiled cache)
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'catalogs',
+                          'threads.csv')
+# Columns of the table file
+TABLE_COLUMNS = ('family', 'name', 'D_nominal', 'pitch', 'TPI', 'D_drill')
+# Change it if the structure of the compiled cache changes
+_CACHE_FORMAT = 1
+# Loaded tables, family -> dictionary column -> list. See getTables().
+_tables = None
+
+# User catalogs state, see refreshUserCatalogs().
+# path -> (st_mtime_ns, st_size, tables) of every parsed user file
+_userFiles = {}
+# Merged user tables, family -> dictionary column -> list
+_userTables = {}
+# Families defined only by user catalogs, list of (family, title)
+_userFamilies = []
+# Messages about user files which could not be used
+_userErrors = []
+# ((path, st_mtime_ns, st_size), ...) of the loaded user files or None
+_userSignature = None
+# Incremented whenever catalogs content changes. Modules with their own
+# indexes over catalogs compare it to know when to rebuild them.
+_generation = 0
+
+# Columns returned by evaluateBatch()
+BATCH_COLUMNS = ('D_nominal', 'D', 'D1', 'd3', 'pitch', 'TPI', 'D_drill')
+# Merged table of all families for evaluateBatch(), built lazily by
+# _getBatchTable(). (generation, names, families, columns)
+_batch = None
+# numpy module, imported by _getNumpy() on the first batch evaluation
+# (False - not tried yet, None - not available). numpy is optional,
+# evaluateBatch() uses array module without it.
+_numpy = False
+
+# Merged index of all families for findBestFit(), findByPitch() and
+# findByTPI(), built lazily by _getMergedIndex(). Dictionary
+# 'internal'/'external'/'pitch'/'TPI' -> (keys, order), keys sorted
+# ascending, 'records' -> all records, 'names' and 'aliases' ->
+# dictionaries for findRecord().
+_merged = None
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Memory - shared values and usage report                |
+# |                                                        |
+# +--------------------------------------------------------+
+def _sharing():
+    """
+    _sharing() -> function x -> x or an equal object of the same type
+                  passed before
+
+    Internal function. Tables repeat the same pitches and diameters many
+    times, records of one catalog keep just one object of each. The
+    lookup dictionary lives only while the function is used.
+    """
+    values = {}
+    def shared(x):
+        return values.setdefault((type(x), x), x)
+    return shared
+
+def _sizeof(obj, seen):
+    """
+    _sizeof(obj, seen) -> bytes of obj and everything it holds
+
+    Internal function. Objects in seen (ids) are not counted again.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _sizeof(k, seen) + _sizeof(v, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for x in obj:
+            size += _sizeof(x, seen)
+    elif isinstance(obj, ThreadCatalog):
+        size += _sizeof(vars(obj), seen)
+    elif _numpy and isinstance(obj, _numpy.ndarray):
+        size = obj.nbytes + sys.getsizeof(_numpy.empty(0))
+    return size
+
+def getMemoryUsage():
+    """
+    getMemoryUsage() -> dictionary part -> bytes
+
+    Memory held by the catalog layer: 'catalogs' (all families loaded so
+    far, records and their values), 'index' (merged search index),
+    'batch' (evaluateBatch() table) and 'total'. Shared objects are
+    counted once, in the first part holding them. Parts not built yet
+    are zero.
+    """
+    seen = set()
+    rslt = {'catalogs': _sizeof(_catalogs, seen),
+            'index': _sizeof(_merged, seen) if _merged is not None else 0,
+            'batch': _sizeof(_batch, seen) if _batch is not None else 0}
+    rslt['total'] = rslt['catalogs'] + rslt['index'] + rslt['batch']
+    return rslt
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | normalizeName() - aliases of thread names              |
+# |                                                        |
+# +--------------------------------------------------------+
+# whole inches and fraction: '1 1/2', '1-1/2'
+_RE_MIXED = re.compile(r'(\d)\s*[\s-]\s*(\d+/\d+)')
+_NAME_TRANS = str.maketrans({',': '.', '\u00d7': 'X', '*': 'X', '"': None})
+
+def normalizeName(text):
+    """
+    normalizeName(text) -> string
+
+    Normalized form of a thread name used by the alias index. Letter case,
+    white characters, inch marks and decimal comma do not matter:
+    'm 10 x 1,25' -> 'M10X1.25', '1 1/2"-6 UNC' and '1-1/2-6UNC'
+    -> '1+1/2-6UNC'.
+    """
+    text = text.upper().replace("''", '').translate(_NAME_TRANS)
+    if '/' in text:
+        text = _RE_MIXED.sub(r'\1+\2', text)
+    return ''.join(text.split())
+
+def findRecord(name):
+    """
+    findRecord(name) -> ThreadRecord or None
+
+    Thread of any family by its name or an alias (see normalizeName()).
+    The first family (getFamilies() order) wins.
+    """
+    merged = _getMergedIndex()
+    rec = merged['names'].get(name)
+    if (rec is None) and isinstance(name, str):
+        rec = merged['aliases'].get(normalizeName(name))
+    return rec
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | getCatalog() - shared catalog instance of a family     |
+# |                                                        |
+# +--------------------------------------------------------+
+def getCatalog(family):
+    """
+    getCatalog(family) -> catalog object
+
+    Returns shared catalog of the family (e.g. 'MetricCoarse1st', 'UNC').
+    Each catalog is created at most once per session. Do not modify
+    the returned object.
+    """
+    if _userSignature is None:
+        refreshUserCatalogs()
+    lthr = _catalogs.get(family)
+    if lthr is None:
+        if family in [x[0] for x in FAMILIES]:
+            module = importlib.import_module(family)
+            lthr = getattr(module, family)()
+        elif family in _userTables:
+            # family defined by user catalog only
+            if len(_userTables[family]['pitch']) > 0:
+                lthr = MetricThreadCatalog(family)
+            else:
+                lthr = UnifiedThreadCatalog(family)
+        else:
+            raise KeyError('Unknown thread family: %s' % family)
+        _catalogs[family] = lthr
+    return lthr
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | getFamilies() - list of families for UI                |
+# |                                                        |
+# +--------------------------------------------------------+
+def getFamilies():
+    """
+    getFamilies() -> list of (family, title)
+
+    Built-in families (FAMILIES) followed by families defined only
+    by user catalogs.
+    """
+    if _userSignature is None:
+        refreshUserCatalogs()
+    return list(FAMILIES) + _userFamilies
+
+def getFamilyTitles():
+    """
+    getFamilyTitles() -> list of families titles (in getFamilies() order)
+    """
+    return [title for family, title in getFamilies()]
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | User catalogs                                          |
+# |                                                        |
+# +--------------------------------------------------------+
+def userCatalogDir():
+    """
+    userCatalogDir() -> path or None
+
+    Directory with user thread catalogs (*.csv in the same format as
+    catalogs/threads.csv, except drills.csv - the drill inventory).
+    It is the environment variable CT3D_USER_CATALOG_DIR if it is set,
+    otherwise CosmeticThread3D in the FreeCAD user data directory if
+    FreeCAD is running.
+    FreeCAD is never imported by this function.
+    """
+    d = os.environ.get('CT3D_USER_CATALOG_DIR')
+    if (d is None) and ('FreeCAD' in sys.modules):
+        d = os.path.join(sys.modules['FreeCAD'].getUserAppDataDir(),
+                         'CosmeticThread3D')
+    return d
+
+def getUserCatalogErrors():
+    """
+    getUserCatalogErrors() -> list of strings
+
+    Problems found by the last refreshUserCatalogs().
+    """
+    return list(_userErrors)
+
+def refreshUserCatalogs():
+    """
+    refreshUserCatalogs() -> bool
+
+    Check the user catalog directory and reload it if any file was
+    added, removed or changed (modification time or size). Unchanged
+    files are not parsed again. Returns True if user catalogs changed
+    - shared catalogs and indexes are dropped and will be rebuilt
+    on the next request.
+
+    Rows of a built-in family are appended to it (for equal names
+    the built-in row wins). A new family is metric (ISO profile) if it
+    is defined by pitch and unified (UN profile) if it is defined by TPI.
+    If a file defines a family by pitch and an earlier catalog by TPI
+    (or vice versa), the rows of the family in that file are ignored
+    and the error names both files. Rows accepted before are kept.
+    """
+    global _userFiles, _userTables, _userFamilies, _userErrors
+    global _userSignature, _merged, _generation
+    sig = []
+    d = userCatalogDir()
+    if d and os.path.isdir(d):
+        for fname in sorted(os.listdir(d)):
+            if not fname.lower().endswith('.csv'):
+                continue
+            if fname.lower() == 'drills.csv':
+                continue # drill inventory, see ct3d_drill
+            path = os.path.join(d, fname)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            sig.append((path, st.st_mtime_ns, st.st_size))
+    sig = tuple(sig)
+    if sig == _userSignature:
+        return False
+    builtin = getTables()
+    files = {}
+    tables = {}
+    families = []
+    errors = []
+    owners = {} # family -> the first user catalog defining it
+    for path, mtime, size in sig:
+        old = _userFiles.get(path)
+        if (old is not None) and (old[0] == mtime) and (old[1] == size):
+            ftables = old[2]
+        else:
+            try:
+                ftables = parseTableFile(path)
+            except (OSError, ValueError, UnicodeDecodeError) as e:
+                errors.append(str(e))
+                ftables = {}
+        files[path] = (mtime, size, ftables)
+        for family, tbl in ftables.items():
+            if family in builtin:
+                ref, owner = builtin[family], 'the built-in catalog'
+            else:
+                ref, owner = tables.get(family), owners.get(family)
+            if (ref is not None) and \
+               ((len(ref['pitch']) > 0) != (len(tbl['pitch']) > 0)):
+                errors.append('%s - family %s is defined by %s in %s, its rows in this file ignored' % \
+                              (path, family,
+                               'pitch' if len(ref['pitch']) > 0 else 'TPI', owner))
+                continue
+            owners.setdefault(family, path)
+            if family not in tables:
+                tables[family] = {'name': [],
+                                  'D_nominal': [],
+                                  'pitch': [],
+                                  'TPI': [],
+                                  'D_drill': []}
+                if family not in builtin:
+                    families.append((family, family))
+            for key in tables[family]:
+                tables[family][key].extend(tbl[key])
+    _userFiles = files
+    _userTables = tables
+    _userFamilies = families
+    _userErrors = errors
+    _userSignature = sig
+    # Drop everything built from the previous state
+    _catalogs.clear()
+    _merged = None
+    _generation += 1
+    return True
+
+def getGeneration():
+    """
+    getGeneration() -> int
+
+    Counter of catalogs content changes (user catalogs reload).
+    """
+    if _userSignature is None:
+        refreshUserCatalogs()
+    return _generation
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | findBestFit() - best fitting threads of all families   |
+# |                                                        |
+# +--------------------------------------------------------+
+def _getMergedIndex():
+    """
+    _getMergedIndex() -> dictionary
+
+    Internal function. Merged and sorted D_drill (internal), D
+    (external), pitch and TPI index over all families, built once.
+    Values are (keys, order) - array('d') of sorted keys and array('i')
+    of positions n in _merged['records'], where n keeps the FAMILIES and
+    the table order. Equal keys are ordered coarse pitch first, then by n.
+    """
+    global _merged
+    if _merged is None:
+        records = []
+        names = {}
+        aliases = {}
+        for family, title in getFamilies():
+            lthr = getCatalog(family)
+            records.extend(lthr._records)
+            for name, i in lthr._index.items():
+                names.setdefault(name, lthr._records[i])
+            for alias, i in lthr._getAlias().items():
+                aliases.setdefault(alias, lthr._records[i])
+        records = tuple(records)
+        _merged = {'records': records, 'names': names, 'aliases': aliases}
+        for key, field in (('internal', 'D_drill'), ('external', 'D'),
+                           ('pitch', 'pitch'), ('TPI', 'TPI')):
+            order = [n for n in range(len(records))
+                     if getattr(records[n], field) > 0.0]
+            order.sort(key=lambda n: (getattr(records[n], field),
+                                      -records[n].pitch, n))
+            _merged[key] = (array.array('d', [getattr(records[n], field) for n in order]),
+                            array.array('i', order))
+    return _merged
+
+def findBestFit(Dobj, internal=True, k=5):
+    """
+    findBestFit(Dobj, internal=True, k=5) -> list of (deviance, ThreadRecord)
+
+    Best fitting threads of all families for the measured hole diameter
+    Dobj (internal=True, compared with D_drill) or shaft diameter Dobj
+    (internal=False, compared with D). Returns at most k candidates sorted
+    by relative deviance abs(x - Dobj) / x, ties by coarser pitch and
+    the FAMILIES order.
+    """
+    merged = _getMergedIndex()
+    records = merged['records']
+    keys, order = merged['internal' if internal else 'external']
+    if (Dobj <= 0.0) or (k <= 0) or (len(keys) == 0):
+        return []
+    # The deviance grows in both directions from the insertion point,
+    # so k rows on each side are enough. Runs of equal keys at the ends
+    # of the window are taken whole to keep the tie breaking exact.
+    i = bisect.bisect_left(keys, Dobj)
+    lo = max(0, i - k)
+    lo = bisect.bisect_left(keys, keys[lo])
+    hi = min(len(keys), i + k)
+    hi = bisect.bisect_right(keys, keys[hi-1])
+    candidates = [(abs(keys[j] - Dobj) / keys[j], -records[order[j]].pitch, order[j])
+                  for j in range(lo, hi)]
+    candidates.sort()
+    return [(x[0], records[x[2]]) for x in candidates[:k]]
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | findByPitch(), findByTPI() - threads of a given pitch  |
+# |                                                        |
+# +--------------------------------------------------------+
+def _findByKey(index, value, tol):
+    """
+    _findByKey(index, value, tol) -> list of (deviation, ThreadRecord)
+
+    Internal function. Records with abs(key - value) <= tol, sorted by
+    the deviation and the FAMILIES order.
+    """
+    merged = _getMergedIndex()
+    records = merged['records']
+    keys, order = merged[index]
+    if value <= 0.0:
+        return []
+    lo = bisect.bisect_left(keys, value - tol)
+    hi = bisect.bisect_right(keys, value + tol)
+    candidates = [(abs(keys[j] - value), order[j]) for j in range(lo, hi)]
+    candidates.sort()
+    return [(x[0], records[x[1]]) for x in candidates]
+
+def findByPitch(pitch, tol=0.005):
+    """
+    findByPitch(pitch, tol=0.005) -> list of (deviation, ThreadRecord)
+
+    Threads of all families with pitch within pitch +- tol [mm], e.g.
+    a measured one. Inch threads are included by their pitch 25.4/TPI.
+    Sorted by deviation abs(x - pitch), ties by the FAMILIES order.
+    """
+    return _findByKey('pitch', pitch, tol)
+
+def findByTPI(TPI, tol=0.05):
+    """
+    findByTPI(TPI, tol=0.05) -> list of (deviation, ThreadRecord)
+
+    Threads of all families with TPI within TPI +- tol, e.g. 20 TPI.
+    Metric threads are included by their TPI 25.4/pitch.
+    Sorted by deviation abs(x - TPI), ties by the FAMILIES order.
+    """
+    return _findByKey('TPI', TPI, tol)
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | evaluateBatch() - parameters of many threads at once   |
+# |                                                        |
+# +--------------------------------------------------------+
+def _getNumpy():
+    """
+    _getNumpy() -> numpy module or None
+
+    Internal function. numpy is imported on the first use only, so
+    the plain catalog use (e.g. ct3d_cli) does not pay for its import.
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+def _getBatchTable():
+    """
+    _getBatchTable() -> (names, families, columns)
+
+    Internal function. All records of all families in one column table.
+    names    - name -> row (first family wins for equal names)
+    families - family -> (name -> row)
+    columns  - numpy 2D array (column, row) or list of array('d').
+               The last row is all zeros, used for unknown names.
+    """
+    global _batch
+    numpy = _getNumpy()
+    generation = getGeneration()
+    if (_batch is None) or (_batch[0] != generation):
+        names = {}
+        families = {}
+        rows = []
+        for family, title in getFamilies():
+            fnames = {}
+            for rec in getCatalog(family)._records:
+                fnames.setdefault(rec.name, len(rows))
+                names.setdefault(rec.name, len(rows))
+                rows.append(tuple(float(getattr(rec, x)) for x in BATCH_COLUMNS))
+            families[family] = fnames
+        rows.append((0.0,) * len(BATCH_COLUMNS))
+        if numpy is not None:
+            columns = numpy.array(rows, dtype=numpy.float64).T.copy()
+        else:
+            columns = [array.array('d', x) for x in zip(*rows)]
+        _batch = (generation, names, families, columns)
+    return _batch[1], _batch[2], _batch[3]
+
+def evaluateBatch(names=None, family=None):
+    """
+    evaluateBatch(names=None, family=None) -> dictionary
+
+    Parameters of many threads at once. names is a sequence of thread
+    names, family limits the name lookup to one family. If names is None,
+    the whole family is evaluated.
+
+    Returns dictionary column -> contiguous array for every column of
+    BATCH_COLUMNS, plus 'found' (array of 0/1). Values are numpy float64
+    arrays if numpy is available, array.array('d') otherwise. Names are
+    resolved as by the getters (variants like 'm10' too, see
+    normalizeName()), unknown names give zeros.
+    """
+    numpy = _getNumpy()
+    allnames, families, columns = _getBatchTable()
+    if family is not None:
+        lookup = families.get(family)
+        if lookup is None:
+            raise KeyError('Unknown thread family: %s' % family)
+        if names is None:
+            names = getCatalog(family).getLstNames()
+    elif names is None:
+        raise ValueError('evaluateBatch() - names or family has to be given')
+    else:
+        lookup = allnames
+    missing = len(columns[0]) - 1 # the zero row
+    names = list(names)
+    idx = [lookup.get(name, missing) for name in names]
+    if missing in idx:
+        # not exact names - the same resolver as the getters
+        for k in range(len(idx)):
+            if (idx[k] == missing) and isinstance(names[k], str):
+                if family is not None:
+                    rec = getCatalog(family).getRecord(names[k])
+                else:
+                    rec = findRecord(names[k])
+                if rec is not None:
+                    idx[k] = families[rec.family].get(rec.name, missing)
+    rslt = {}
+    if numpy is not None:
+        idx = numpy.array(idx, dtype=numpy.intp)
+        values = columns[:, idx] # one vectorized gather of all columns
+        for k in range(len(BATCH_COLUMNS)):
+            rslt[BATCH_COLUMNS[k]] = values[k]
+        rslt['found'] = (idx != missing).astype(numpy.int8)
+    else:
+        for k in range(len(BATCH_COLUMNS)):
+            col = columns[k]
+            rslt[BATCH_COLUMNS[k]] = array.array('d', [col[i] for i in idx])
+        rslt['found'] = array.array('b', [int(i != missing) for i in idx])
+    return rslt
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Thread tables - csv source and compiled cache          |
+# |                                                        |
+# +--------------------------------------------------------+
+def _parseNumber(text):
+    """
+    _parseNumber(text) -> int or float
+
+    Internal function. '10' -> 10, '1.5' -> 1.5 (the same types as
+    the former hand written tables).
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def parseTableFile(path):
+    """
+    parseTableFile(path) -> dictionary family -> dictionary column -> list
+
+    Parse thread table in csv format (see catalogs/threads.csv). Empty
+    lines and lines starting with '#' are ignored. Empty pitch or TPI
+    is allowed, the catalog computes it from the other one.
+    Raises ValueError on a malformed line, the message starts with
+    path:line.
+    """
+    tables = {}
+    header = None
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        # Names contain '"' (e.g. 1/4"-20 UNC), quoting is not used
+        reader = csv.reader(f, quoting=csv.QUOTE_NONE)
+        for row in reader:
+            if (len(row) == 0) or row[0].startswith('#'):
+                continue
+            where = '%s:%d' % (path, reader.line_num)
+            if header is None:
+                header = tuple(x.strip() for x in row)
+                if header != TABLE_COLUMNS:
+                    raise ValueError('%s - unexpected header %s' % (where, row))
+                continue
+            if len(row) != len(TABLE_COLUMNS):
+                raise ValueError('%s - malformed line %s' % (where, row))
+            try:
+                values = [_parseNumber(row[k]) if row[k].strip() != '' else None
+                          for k in range(2, 6)]
+            except ValueError:
+                raise ValueError('%s - malformed number in line %s' % (where, row))
+            if (values[0] is None) or (values[3] is None):
+                raise ValueError('%s - D_nominal and D_drill are required %s' % (where, row))
+            family = row[0].strip()
+            tbl = tables.get(family)
+            if tbl is None:
+                tbl = {'name': [],
+                       'D_nominal': [],
+                       'pitch': [],
+                       'TPI': [],
+                       'D_drill': []}
+                tables[family] = tbl
+            tbl['name'].append(row[1].strip())
+            tbl['D_nominal'].append(values[0])
+            if values[1] is not None:
+                tbl['pitch'].append(values[1])
+            if values[2] is not None:
+                tbl['TPI'].append(values[2])
+            tbl['D_drill'].append(values[3])
+    for family, tbl in tables.items():
+        n = len(tbl['name'])
+        if not ((len(tbl['pitch']) == n and len(tbl['TPI']) == 0) or
+                (len(tbl['TPI']) == n and len(tbl['pitch']) == 0)):
+            raise ValueError('%s - family %s has to be defined either by pitch or by TPI' % (path, family))
+    return tables
+
+def _cacheDir():
+    """
+    _cacheDir() -> private directory of the compiled caches or None
+
+    Internal function. CosmeticThread3D/cache in the FreeCAD user data
+    directory if FreeCAD is running, ct3d in XDG_CACHE_HOME (~/.cache)
+    otherwise. The directory is created if it is missing. None if it
+    can not be created or other users could write into it - the tables
+    are parsed without a cache then.
+    """
+    if 'FreeCAD' in sys.modules:
+        d = os.path.join(sys.modules['FreeCAD'].getUserAppDataDir(),
+                         'CosmeticThread3D', 'cache')
+    else:
+        d = os.path.join(os.environ.get('XDG_CACHE_HOME') or
+                         os.path.join(os.path.expanduser('~'), '.cache'),
+                         'ct3d')
+    try:
+        os.makedirs(d, mode=0o700, exist_ok=True)
+        st = os.stat(d)
+    except OSError:
+        return None
+    if hasattr(os, 'getuid') and \
+       ((st.st_uid != os.getuid()) or (st.st_mode & 0o022)):
+        return None # not ours or writable by others
+    if not os.access(d, os.W_OK):
+        return None
+    return d
+
+def _cachePath(path):
+    """
+    _cachePath(path) -> path of the compiled cache of the table file or None
+
+    Internal function. The cache is stored in the private cache
+    directory of the user (see _cacheDir()), the name is made of
+    the table file path. None if there is no such directory.
+    """
+    d = _cacheDir()
+    if d is None:
+        return None
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(d, '%s_%08x.cache' %
+                        (name, zlib.crc32(os.path.abspath(path).encode('utf-8'))))
+
+def loadTableFile(path):
+    """
+    loadTableFile(path) -> dictionary family -> dictionary column -> list
+
+    Load thread table through its compiled cache. The cache is used only
+    if it was made from the same file (modification time and size) by
+    the same python version, otherwise the csv is parsed and the cache
+    is written again. Without a private cache directory the csv is
+    parsed every time.
+    """
+    st = os.stat(path)
+    stamp = (_CACHE_FORMAT,
+             tuple(sys.version_info[:2]),
+             os.path.abspath(path),
+             st.st_mtime_ns,
+             st.st_size)
+    cache = _cachePath(path)
+    if cache is None:
+        return parseTableFile(path)
+    try:
+        with open(cache, 'rb') as f:
+            data = marshal.loads(f.read())
+        if data[0] == stamp:
+            return data[1]
+    except (OSError, ValueError, EOFError, TypeError, IndexError):
+        pass # no cache or a broken one - parse the source
+    tables = parseTableFile(path)
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(cache))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(marshal.dumps((stamp, tables)))
+        os.replace(tmp, cache)
+        tmp = None
+    except OSError:
+        pass # the cache is just an optimization
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    return tables
+
+def getTables():
+    """
+    getTables() -> dictionary family -> dictionary column -> list
+
+    Built-in thread tables, loaded once per session. Do not modify
+    the returned object.
+    """
+    global _tables
+    if _tables is None:
+        _tables = loadTableFile(TABLE_FILE)
+    return _tables
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | ThreadCatalog - common base of all thread catalogs     |
+# |                                                        |
+# +--------------------------------------------------------+
+class ThreadCatalog:
+    """
+    class ThreadCatalog
+
+    Common base of all thread catalogs. The catalog is filled from
+    the thread tables (see getTables()) and user catalogs by the family
+    name. The family is the class name if it is not given, e.g. class
+    UNC is filled by rows of family 'UNC'.
+
+    Threads are kept as immutable ThreadRecord tuples only, equal numbers
+    share one object (see _sharing()). Sorted indexes are array columns.
+
+    Getters find a thread by its exact name first, then by the alias
+    index - normalized names and variants made by _aliases().
+
+    A derived class may also fill the catalog by its own columns - call
+    _buildIndex(name, D_nominal, pitch, TPI, D_drill) in its __init__.
+    """
+
+    def __init__(self, family=None):
+        self._name = []
+        self._records = ()
+        self._index = {}
+        self._alias = None
+        self._byD = array.array('i')
+        self._byD_keys = array.array('d')
+        self._byD_drill = array.array('i')
+        self._byD_drill_keys = array.array('d')
+        self.family = type(self).__name__ if family is None else family
+        if _userSignature is None:
+            refreshUserCatalogs()
+        tbls = [x for x in (getTables().get(self.family),
+                            _userTables.get(self.family)) if x is not None]
+        if len(tbls) > 0:
+            columns = {'name': [],
+                       'D_nominal': [],
+                       'pitch': [],
+                       'TPI': [],
+                       'D_drill': []}
+            for tbl in tbls:
+                for key in columns:
+                    columns[key].extend(tbl[key])
+            self._buildIndex(**columns)
+
+    def _buildIndex(self, name, D_nominal, pitch, TPI, D_drill):
+        """
+        _buildIndex(name, D_nominal, pitch, TPI, D_drill) -> None
+
+        Compute derived columns (pitch or TPI, D1, d3), make records and
+        build name -> position index. Either pitch or TPI may be empty.
+        If a name is in the table more than once, the first one wins
+        (the same as the former linear scan).
+        """
+        pitch, TPI = self._completePitchTPI(pitch, TPI)
+        _shared = _sharing()
+        family = self.family
+        self._records = tuple(ThreadRecord(n, family,
+                                           _shared(D), _shared(p), _shared(t),
+                                           _shared(D),
+                                           _shared(self._calcD1(D, p)),
+                                           _shared(self._calcd3(D, p)),
+                                           _shared(Dd))
+                              for n, D, p, t, Dd in zip(name, D_nominal,
+                                                        pitch, TPI, D_drill))
+        self._name = [x.name for x in self._records]
+        self._index = {}
+        i = 0
+        while i < len(self._name):
+            self._index.setdefault(self._name[i], i)
+            i += 1
+        # Aliases are built on the first lookup miss, see _getAlias()
+        self._alias = None
+        # Sorted indexes for nearest diameter search. Equal diameters are
+        # ordered coarse pitch first, then by position in the table.
+        # Zero D_drill means 'not defined' and it is not indexed.
+        self._byD = self._sortedBy('D')
+        self._byD_keys = array.array('d', [self._records[i].D for i in self._byD])
+        self._byD_drill = self._sortedBy('D_drill')
+        self._byD_drill_keys = array.array('d', [self._records[i].D_drill
+                                                 for i in self._byD_drill])
+
+    def _aliases(self, rec, name):
+        """
+        _aliases(rec, name) -> list of normalized alias names
+
+        Variants of the normalized name of the record, e.g. M10X1.5 for M10.
+        """
+        return []
+
+    def _getAlias(self):
+        """
+        _getAlias() -> dictionary normalized name -> position in the table
+
+        Alias index, built on the first use - most lookups hit the exact
+        name and the construction of a catalog stays cheap. Normalized
+        names go first, so a variant never hides a real name.
+        """
+        if self._alias is None:
+            alias = {}
+            normalized = [normalizeName(x) for x in self._name]
+            for i in range(len(self._records)):
+                alias.setdefault(normalized[i], i)
+            for i in range(len(self._records)):
+                for x in self._aliases(self._records[i], normalized[i]):
+                    alias.setdefault(x, i)
+            self._alias = alias
+        return self._alias
+
+    def _find(self, ThrName):
+        """
+        _find(ThrName) -> position in the table or None
+
+        Exact name, then the alias index. Getters try the exact name
+        themselves first (the common case without a call).
+        """
+        i = self._index.get(ThrName)
+        if (i is None) and isinstance(ThrName, str):
+            i = self._getAlias().get(normalizeName(ThrName))
+        return i
+
+    def _sortedBy(self, field):
+        """
+        _sortedBy(field) -> array of record positions sorted by field value
+        """
+        recs = self._records
+        lst = [i for i in range(len(recs)) if getattr(recs[i], field) > 0.0]
+        lst.sort(key=lambda i: (getattr(recs[i], field), -recs[i].pitch, i))
+        return array.array('i', lst)
+
+    def getNearestIndex(self, Dobj, internal=True):
+        """
+        getNearestIndex(Dobj, internal=True) -> int >= 0
+
+        Position of the thread best fitting to hole diameter Dobj
+        (internal=True, compared with D_drill) or to shaft diameter Dobj
+        (internal=False, compared with D). The relative deviance
+        abs(x - Dobj) / x is minimized by binary search. Ties are broken
+        by coarser pitch, then by position in the table.
+        Returns 0 for an empty catalog or Dobj <= 0.
+        """
+        if internal:
+            order, keys = self._byD_drill, self._byD_drill_keys
+        else:
+            order, keys = self._byD, self._byD_keys
+        if (Dobj <= 0.0) or (len(order) == 0):
+            return 0
+        k = bisect.bisect_left(keys, Dobj)
+        candidates = []
+        if k > 0:
+            # first of equal keys is the preferred one (coarse pitch)
+            candidates.append(bisect.bisect_left(keys, keys[k-1]))
+        if k < len(keys):
+            candidates.append(k)
+        best = None
+        for j in candidates:
+            i = order[j]
+            deviance = abs(keys[j] - Dobj) / keys[j]
+            rank = (deviance, -self._records[i].pitch, i)
+            if (best is None) or (rank < best):
+                best = rank
+        return best[2]
+
+    def getRecord(self, ThrName):
+        """
+        getRecord(ThrName) -> ThreadRecord or None
+
+        All parameters of the thread by one lookup.
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return None if i is None else self._records[i]
+
+    def getRecordByIndex(self, i):
+        """
+        getRecordByIndex(i) -> ThreadRecord or None
+        """
+        x = None
+        if 0 <= i < len(self._records):
+            x = self._records[i]
+        return x
+
+    def getLstNames(self):
+        """
+        getLstNames() -> list of threads names
+        """
+        return self._name
+
+    def getName(self, i):
+        """
+        getName(i) -> name
+
+        name = string or None
+        """
+        x = None
+        if i < len(self._name):
+            x = self._name[i]
+        return x
+
+    def getD_nominal(self, ThrName):
+        """
+        getD_nominal(ThrName) -> D_nominal
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].D_nominal
+
+    def getD(self, ThrName):
+        """
+        getD(ThrName) -> D
+        """
+        # in the case of all supported threads is D equal to D_nominal
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].D
+
+    def getD_drill(self, ThrName):
+        """
+        getD_drill(ThrName) -> D_drill
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].D_drill
+
+    def getD1(self, ThrName):
+        """
+        getD1(ThrName) -> D1
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].D1
+
+    def getd3(self, ThrName):
+        """
+        getd3(ThrName) -> d3
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].d3
+
+    def getpitch(self, ThrName):
+        """
+        getpitch(ThrName) -> pitch
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].pitch
+
+    def getTPI(self, ThrName):
+        """
+        getTPI(ThrName) -> TPI
+        """
+        i = self._index.get(ThrName)
+        if i is None:
+            i = self._find(ThrName)
+        return 0.0 if i is None else self._records[i].TPI
+
+    def _completePitchTPI(self, pitch, TPI):
+        """
+        _completePitchTPI(pitch, TPI) -> (pitch, TPI)
+
+        Fill the pitch or TPI column from the other one.
+        """
+        raise NotImplementedError
+
+    def _calcD1(self, D, pitch):
+        """
+        _calcD1(D, pitch) -> D1 (minor diameter of the internal thread)
+        """
+        raise NotImplementedError
+
+    def _calcd3(self, D, pitch):
+        """
+        _calcd3(D, pitch) -> d3 (minor diameter of the external thread)
+        """
+        raise NotImplementedError
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | MetricThreadCatalog - ISO metric threads               |
+# |                                                        |
+# +--------------------------------------------------------+
+class MetricThreadCatalog(ThreadCatalog):
+    """
+    class MetricThreadCatalog
+
+    Base of ISO metric thread catalogs. Table is defined by pitch.
+    """
+
+    def _completePitchTPI(self, pitch, TPI):
+        return pitch, [round(25.4 / x, 3) if x > 0.0 else 0.0 for x in pitch]
+
+    def _aliases(self, rec, name):
+        # coarse thread without pitch: M10 is M10x1.5
+        if (rec.pitch > 0.0) and ('X' not in name):
+            return [name + 'X%g' % rec.pitch]
+        return []
+
+    def _calcD1(self, D, pitch):
+        H = pitch * 0.5 * math.sqrt(3)
+        return round(D - 2*H*(5/8), 3)
+
+    def _calcd3(self, D, pitch):
+        H = pitch * 0.5 * math.sqrt(3)
+        return round(D - 2*H*(1 - (1/6) - (1/8)), 3)
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | InchThreadCatalog - threads defined by TPI             |
+# |                                                        |
+# +--------------------------------------------------------+
+class InchThreadCatalog(ThreadCatalog):
+    """
+    class InchThreadCatalog
+
+    Base of thread catalogs defined by Threads Per Inch (UNC, BSW, G...).
+    """
+
+    def _completePitchTPI(self, pitch, TPI):
+        return [round(25.4 / x, 3) if x > 0.0 else 0.0 for x in TPI], TPI
+
+
+
+class UnifiedThreadCatalog(InchThreadCatalog):
+    """
+    class UnifiedThreadCatalog
+
+    Base of Unified Thread Standard catalogs (UNC, UNF, UNEF).
+    """
+
+    def _aliases(self, rec, name):
+        # 1/4-20UNC -> 0.25-20UNC, 1/4-20, 0.25-20
+        if '-' not in name:
+            return []
+        size, rest = name.split('-', 1)
+        decimal = '%g' % round(rec.D_nominal / 25.4, 4)
+        base = rest.rstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+        return [decimal + '-' + rest, size + '-' + base, decimal + '-' + base]
+
+    def _calcD1(self, D, pitch):
+        H = pitch*0.5*math.sqrt(3)
+        # D min = D maj - 2 * 5/8 * H = D maj - 1.25 * H
+        return round(D - 1.25*H, 3)
+
+    def _calcd3(self, D, pitch):
+        H = pitch*0.5*math.sqrt(3)
+        # D min = D maj - 2 * 5/8 * H = D maj - 1.25 * H
+        return round(D - 1.25*H, 3)
+
+
+
+class WhitworthThreadCatalog(InchThreadCatalog):
+    """
+    class WhitworthThreadCatalog
+
+    Base of British Standard Whitworth thread catalogs (BSW, BSF).
+    """
+
+    def _aliases(self, rec, name):
+        # BSW1/4 -> 1/4BSW
+        return [name[3:] + name[:3]]
+
+    def _calcD1(self, D, pitch):
+        h = pitch / (3.0*math.tan(27.5*math.pi/180.0))
+        # This equation can not be exactly as I write it here.
+        # This equation is basic thread profile, not nut with some clearence.
+        return round(D - 2*h, 3)
+
+    def _calcd3(self, D, pitch):
+        h = pitch / (3.0*math.tan(27.5*math.pi/180.0))
+        # This equation can not be exactly as I write it here.
+        # This equation is basic thread profile, not bolt with some clearence.
+        return round(D - 2*h, 3)
+
+
+
+class PipeThreadCatalog(InchThreadCatalog):
+    """
+    class PipeThreadCatalog
+
+    Base of British Standard Pipe Parallel thread catalogs (G / BSPP).
+    """
+
+    def _aliases(self, rec, name):
+        # G1/2 -> 1/2G, BSPP1/2, 1/2BSPP
+        size = name[1:]
+        return [size + 'G', 'BSPP' + size, size + 'BSPP']
+
+    def _calcD1(self, D, pitch):
+        h = 0.6403*pitch
+        # This equation can not be exactly as I write it here.
+        # This equation is basic thread profile, not nut with some clearence.
+        return round(D - 2*h, 3)
+
+    def _calcd3(self, D, pitch):
+        h = 0.6403*pitch
+        # This equation can not be exactly as I write it here.
+        # This equation is basic thread profile, not bolt with some clearence.
+        return round(D - 2*h, 3)
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_cli.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Thread catalog command line tool and module for scripts without FreeCAD.
+
+    python ct3d_cli.py query M10 '1/4"-20 UNC' --format json
+    python ct3d_cli.py search 8.4 [--external] [-k 5]
+    python ct3d_cli.py bulk [--input csv|json|lines] [--format csv|json|text] < file
+    python ct3d_cli.py families
+
+query  - parameters of threads by designation (see ct3d_designation)
+search - best fitting threads for a measured hole (D_drill) or shaft (D)
+         diameter of all families
+bulk   - designations streamed from stdin, one result per input line.
+         lines: one designation per line; csv: designation in the first
+         column (a header line 'designation' is skipped); json: JSON lines,
+         a string or an object with key 'designation'.
+
+Only the catalog layer is imported - no FreeCAD, Part or PySide.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+import ct3d_catalog
+import ct3d_designation
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# Output columns. deviance - relative deviance of search results,
+# error - why the thread was not found (empty for found threads)
+FIELDS = ('query', 'name', 'family', 'D_nominal', 'D', 'D1', 'd3',
+          'pitch', 'TPI', 'D_drill', 'deviance', 'error')
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Module API                                             |
+# |                                                        |
+# +--------------------------------------------------------+
+def recordToDict(rec, query='', error='', deviance=None):
+    """
+    recordToDict(rec, query='', error='', deviance=None) -> dictionary of FIELDS
+
+    rec may be None (not found), numbers are empty then. deviance of
+    search results is rounded to 4 decimal places, empty if it is None.
+    """
+    rslt = dict.fromkeys(FIELDS, '')
+    if rec is not None:
+        rslt.update(rec._asdict())
+    rslt['query'] = query
+    if deviance is not None:
+        rslt['deviance'] = round(deviance, 4)
+    rslt['error'] = error or ''
+    return rslt
+
+def lookup(designation, family=None):
+    """
+    lookup(designation, family=None) -> dictionary of FIELDS
+
+    Thread parameters by designation. With family the exact catalog name
+    of that family is required. 'error' is not empty if there is no such
+    thread.
+    """
+    if family is not None:
+        try:
+            rec = ct3d_catalog.getCatalog(family).getRecord(designation)
+        except KeyError as e:
+            return recordToDict(None, designation, str(e.args[0]))
+        if rec is None:
+            return recordToDict(None, designation,
+                                'No thread %r in family %s' % (designation, family))
+        return recordToDict(rec, designation)
+    try:
+        rec = ct3d_designation.parseDesignation(designation)
+    except ct3d_designation.DesignationError as e:
+        return recordToDict(None, designation, str(e))
+    return recordToDict(rec, designation)
+
+def search(D, internal=True, k=5):
+    """
+    search(D, internal=True, k=5) -> list of dictionaries of FIELDS
+
+    Best fitting threads of all families for the measured hole (internal,
+    compared with D_drill) or shaft (compared with D) diameter, with
+    the relative deviance in 'deviance'.
+    """
+    return [recordToDict(rec, str(D), deviance=dev)
+            for dev, rec in ct3d_catalog.findBestFit(D, internal, k)]
+
+def readDesignations(stream, fmt='lines'):
+    """
+    readDesignations(stream, fmt='lines') -> generator of designations
+
+    Designations from a text stream, see bulk in the module description.
+    Empty lines are skipped.
+    """
+    if fmt == 'csv':
+        # Names contain '"' (e.g. 1/4"-20 UNC), quoting is not used
+        first = True
+        for row in csv.reader(stream, quoting=csv.QUOTE_NONE):
+            if (len(row) == 0) or (row[0].strip() == ''):
+                continue
+            if first and (row[0].strip().lower() == 'designation'):
+                first = False
+                continue
+            first = False
+            yield row[0].strip()
+    elif fmt == 'json':
+        for line in stream:
+            line = line.strip()
+            if line == '':
+                continue
+            item = json.loads(line)
+            if isinstance(item, dict):
+                item = item.get('designation', '')
+            yield str(item)
+    else:
+        for line in stream:
+            line = line.strip()
+            if line != '':
+                yield line
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Output                                                 |
+# |                                                        |
+# +--------------------------------------------------------+
+class _Writer:
+    """
+    Streamed output of result dictionaries in csv, json lines or text.
+    """
+
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.fmt = fmt
+        self.csv = None
+        if fmt == 'csv':
+            # the same style as catalogs/threads.csv - names unquoted
+            self.csv = csv.DictWriter(stream, FIELDS, quoting=csv.QUOTE_NONE,
+                                      quotechar=None, escapechar='\\',
+                                      lineterminator='\n')
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.fmt == 'csv':
+            self.csv.writerow(row)
+        elif self.fmt == 'json':
+            self.stream.write(json.dumps(row, ensure_ascii=False) + '\n')
+        elif row['error'] and not row['name']:
+            self.stream.write('%s: %s\n' % (row['query'], row['error']))
+        else:
+            self.stream.write('%-16s %-16s D=%s D1=%s d3=%s P=%s TPI=%s D_drill=%s%s\n' % \
+                              (row['name'], row['family'], row['D'], row['D1'],
+                               row['d3'], row['pitch'], row['TPI'], row['D_drill'],
+                               '  (deviance %.4f)' % row['deviance'] if row['deviance'] != '' else ''))
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | main() - command line                                  |
+# |                                                        |
+# +--------------------------------------------------------+
+def _parser():
+    """
+    _parser() -> argparse.ArgumentParser. Internal function.
+    """
+    parser = argparse.ArgumentParser(prog='ct3d_cli',
+                                     description='Cosmetic Thread 3D thread catalogs.')
+    sub = parser.add_subparsers(dest='command')
+    sub.required = True
+    p = sub.add_parser('query', help='parameters of threads by designation')
+    p.add_argument('designation', nargs='+')
+    p.add_argument('--family', help='exact name in this family only')
+    p.add_argument('--format', choices=('text', 'csv', 'json'), default='text')
+    p = sub.add_parser('search', help='best fitting threads for a diameter [mm]')
+    p.add_argument('D', type=float)
+    p.add_argument('--external', action='store_true',
+                   help='shaft diameter (default hole diameter)')
+    p.add_argument('-k', type=int, default=5, help='number of candidates')
+    p.add_argument('--format', choices=('text', 'csv', 'json'), default='text')
+    p = sub.add_parser('bulk', help='designations from stdin')
+    p.add_argument('--input', choices=('lines', 'csv', 'json'), default='lines')
+    p.add_argument('--family', help='exact name in this family only')
+    p.add_argument('--format', choices=('text', 'csv', 'json'), default='csv')
+    sub.add_parser('families', help='list of thread families')
+    return parser
+
+def main(argv=None, stdin=None, stdout=None):
+    """
+    main(argv=None, stdin=None, stdout=None) -> exit code
+
+    0 - all found, 1 - some designation not found, 2 - bad arguments
+    or input.
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    args = _parser().parse_args(argv)
+    ct3d_catalog.refreshUserCatalogs()
+    for err in ct3d_catalog.getUserCatalogErrors():
+        sys.stderr.write('ct3d_cli: %s\n' % err)
+    if args.command == 'families':
+        for family, title in ct3d_catalog.getFamilies():
+            stdout.write('%s\t%s\n' % (family, title))
+        return 0
+    out = _Writer(stdout, args.format)
+    if args.command == 'search':
+        for row in search(args.D, not args.external, args.k):
+            out.write(row)
+        return 0
+    if args.command == 'query':
+        designations = args.designation
+    else:
+        designations = readDesignations(stdin, args.input)
+    rslt = 0
+    try:
+        for designation in designations:
+            row = lookup(designation, args.family)
+            if not row['name']:
+                rslt = 1
+            out.write(row)
+    except ValueError as e: # bad json line
+        sys.stderr.write('ct3d_cli: %s\n' % e)
+        return 2
+    return rslt
+
+if __name__ == '__main__':
+    sys.exit(main())
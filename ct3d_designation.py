@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_designation.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Thread designation parser - maps free text callouts like 'M10x1.25',
+'m10', '1/4"-20 UNC', '1/4-20UNC', '#10-24 UNC', 'BSW 1/2"' or 'G1/2'
+onto catalog records.
+
+Catalog names and their aliases ('m10', 'M10x1.5', '0.25-20 UNC' - see
+ct3d_catalog.normalizeName()) are found by one dictionary lookup in
+ct3d_catalog.findRecord(). Other texts are parsed by precompiled
+patterns into a key (thread system, nominal size, pitch or TPI,
+series). Every catalog name is parsed by the same patterns once, so
+the text and the catalog names meet in one dictionary. Results are
+memoized (LRU), repeated callouts in big imports cost one dictionary
+lookup.
+
+This module does not import FreeCAD.
+"""
+
+import functools
+import re
+
+import ct3d_catalog
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | DesignationError - designation can not be resolved     |
+# |                                                        |
+# +--------------------------------------------------------+
+class DesignationError(ValueError):
+    """
+    Designation can not be parsed or there is no such thread in catalogs.
+    """
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Patterns                                               |
+# |                                                        |
+# +--------------------------------------------------------+
+# number with decimal point or comma
+_NUM = r'\d+(?:[.,]\d+)?'
+# inch size: 1/4, 1 1/8, 1-1/8, 0.25, 2
+_SIZE = r'\d+(?:[ -]\d+/\d+|/\d+|[.,]\d+)?'
+# optional tolerance class at the end: -6g, 6H, 2A, -2B
+_TOL = r'(?:\s*-?\s*\d[a-hA-H](?:\d[a-hA-H])?)?'
+
+# M10, M10x1.25, m 10 x 1,25, M10x1.25-6g
+_RE_METRIC = re.compile(r'^M\s*(' + _NUM + r')\s*(?:[x*×]\s*(' + _NUM + r'))?' +
+                        _TOL + r'$', re.IGNORECASE)
+# 1/4"-20 UNC, 1/4-20UNC, 0.25-20 UNC, #10-24 UNC, 2"-4 1/2 UNC, 1/4-20 UNC-2A
+_RE_UNIFIED = re.compile(r'^(?:#\s*(\d+)|(' + _SIZE + r'))\s*(?:"|\'\'|in)?\s*-\s*' +
+                         r'(\d+(?:\s+\d+/\d+)?)\s*-?\s*(UNC|UNF|UNEF|UN)?' +
+                         r'(?:\s*-?\s*\d[AB])?$', re.IGNORECASE)
+# BSW1/2, BSW 1/2", 1/2" BSW, BSF 1 1/8
+_RE_WHITWORTH_A = re.compile(r'^(BSW|BSF)\s*(' + _SIZE + r')\s*(?:"|\'\'|in)?$',
+                             re.IGNORECASE)
+_RE_WHITWORTH_B = re.compile(r'^(' + _SIZE + r')\s*(?:"|\'\'|in)?\s*(BSW|BSF)$',
+                             re.IGNORECASE)
+# G1/2, G 1/2", G1/2A, BSPP 1/2, 1/2" BSPP
+_RE_PIPE_A = re.compile(r'^(?:G|BSPP)\s*(' + _SIZE + r')\s*(?:"|\'\'|in)?\s*[AB]?$',
+                        re.IGNORECASE)
+_RE_PIPE_B = re.compile(r'^(' + _SIZE + r')\s*(?:"|\'\'|in)?\s*(?:G|BSPP)$',
+                        re.IGNORECASE)
+# whole inches and fraction separator in sizes like 1 1/8 or 1-1/8
+_RE_SIZE_SPLIT = re.compile(r'[ -]')
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | parseKey() - designation text -> key                   |
+# |                                                        |
+# +--------------------------------------------------------+
+def _number(text):
+    """
+    _number(text) -> float, decimal comma allowed. Internal function.
+    """
+    return float(text.replace(',', '.'))
+
+def _inches(text):
+    """
+    _inches(text) -> float
+
+    Internal function. '1/4' -> 0.25, '1 1/8' or '1-1/8' -> 1.125,
+    '0.25' -> 0.25
+    """
+    text = text.replace(',', '.')
+    whole = 0.0
+    parts = _RE_SIZE_SPLIT.split(text)
+    if len(parts) == 2:
+        whole = float(parts[0])
+        text = parts[1]
+    if '/' in text:
+        num, den = text.split('/')
+        return whole + float(num) / float(den)
+    return whole + float(text)
+
+def parseKey(text):
+    """
+    parseKey(text) -> tuple or None
+
+    Normalized key of the designation:
+        ('M', D [mm], pitch [mm] or None)
+        ('UN', D [in], TPI, 'UNC'/'UNF'/'UNEF'/'UN' or None)
+        ('BSW', D [in]), ('BSF', D [in]), ('G', D [in])
+    Returns None if the text is not a known designation style.
+    """
+    text = ' '.join(text.split())
+    m = _RE_METRIC.match(text)
+    if m:
+        pitch = None if m.group(2) is None else round(_number(m.group(2)), 4)
+        return ('M', round(_number(m.group(1)), 4), pitch)
+    m = _RE_UNIFIED.match(text)
+    if m:
+        if m.group(1) is not None:
+            # numbered sizes #0..#12: D = 0.060 + 0.013 * n inch
+            D = 0.060 + 0.013 * int(m.group(1))
+        else:
+            D = _inches(m.group(2))
+        series = None if m.group(4) is None else m.group(4).upper()
+        return ('UN', round(D, 4), round(_inches(m.group(3)), 4), series)
+    m = _RE_WHITWORTH_A.match(text)
+    if m:
+        return (m.group(1).upper(), round(_inches(m.group(2)), 4))
+    m = _RE_WHITWORTH_B.match(text)
+    if m:
+        return (m.group(2).upper(), round(_inches(m.group(1)), 4))
+    m = _RE_PIPE_A.match(text) or _RE_PIPE_B.match(text)
+    if m:
+        return ('G', round(_inches(m.group(1)), 4))
+    return None
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Key index over all catalogs                            |
+# |                                                        |
+# +--------------------------------------------------------+
+# (generation, {key: record}) - see _getIndex()
+_index = None
+
+def _getIndex():
+    """
+    _getIndex() -> keys dictionary
+
+    Internal function. Keys of all catalog records, built once per
+    catalogs generation. The first family (getFamilies() order) wins
+    for equal keys.
+    """
+    global _index
+    generation = ct3d_catalog.getGeneration()
+    if (_index is None) or (_index[0] != generation):
+        keys = {}
+        for family, title in ct3d_catalog.getFamilies():
+            lthr = ct3d_catalog.getCatalog(family)
+            i = 0
+            rec = lthr.getRecordByIndex(i)
+            while rec is not None:
+                key = parseKey(rec.name)
+                if key is not None:
+                    keys.setdefault(key, rec)
+                    if key[0] == 'M':
+                        # M10 is also M10x1.5
+                        keys.setdefault(('M', key[1], round(rec.pitch, 4)), rec)
+                    elif key[0] == 'UN':
+                        # series may be omitted in the callout
+                        keys.setdefault(key[:3] + (None,), rec)
+                i += 1
+                rec = lthr.getRecordByIndex(i)
+        _index = (generation, keys)
+        _resolve.cache_clear()
+    return _index[1]
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | parseDesignation() - designation text -> record        |
+# |                                                        |
+# +--------------------------------------------------------+
+@functools.lru_cache(maxsize=8192)
+def _resolve(text):
+    """
+    _resolve(text) -> ThreadRecord or error message (string)
+
+    Internal function, memoized. Errors are returned, not raised, so they
+    are memoized too.
+    """
+    keys = _getIndex()
+    rec = ct3d_catalog.findRecord(text) # exact name or alias
+    if rec is not None:
+        return rec
+    key = parseKey(text)
+    if key is None:
+        return 'Unknown designation style: %r' % text
+    rec = keys.get(key)
+    if rec is None:
+        return 'No catalog thread for designation: %r' % text
+    return rec
+
+def parseDesignation(text):
+    """
+    parseDesignation(text) -> ThreadRecord
+
+    Catalog record of the thread designation text. Surrounding white
+    characters and letter case do not matter, tolerance class suffix
+    (e.g. '-6g', '-2A') is ignored.
+    Raises DesignationError if it can not be resolved, TypeError if text
+    is not a string.
+    """
+    if not isinstance(text, str):
+        raise TypeError('Designation has to be a string, not %s' % type(text).__name__)
+    _getIndex() # drop memoized results if catalogs were changed
+    rslt = _resolve(text.strip())
+    if isinstance(rslt, str):
+        raise DesignationError(rslt)
+    return rslt
+
+def parseStream(lines):
+    """
+    parseStream(lines) -> generator of (text, ThreadRecord or None, error)
+
+    Resolve designations one by one, e.g. lines of a file. Errors do not
+    stop the stream, error is None for resolved lines.
+    """
+    _getIndex()
+    for line in lines:
+        text = line.strip()
+        rslt = _resolve(text)
+        if isinstance(rslt, str):
+            yield (text, None, rslt)
+        else:
+            yield (text, rslt, None)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_drill.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Tap drill stock matching - maps the recommended pre-drilled hole
+diameter (D_drill) onto the nearest drill of the shop inventory.
+
+The inventory is a csv file (see catalogs/drills.csv). The shop file is
+drills.csv in the user catalog directory or the file set by the
+environment variable CT3D_DRILL_INVENTORY. It is read again only when
+it is changed, the file is checked at most once per CHECK_INTERVAL
+seconds - a recompute of many threads costs one os.stat().
+
+Drills are kept sorted, one search is a bisection. Bias selects
+the drill for D_drill between two stocked sizes:
+    'Nearest'   - the closer one (oversize on a tie)
+    'Oversize'  - the smallest drill >= D_drill
+    'Undersize' - the largest drill <= D_drill
+
+This module does not import FreeCAD.
+"""
+
+import bisect
+import collections
+import csv
+import os
+import time
+
+import ct3d_catalog
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# Stocked drill, D in mm
+Drill = collections.namedtuple('Drill', ('D', 'name'))
+
+BIASES = ('Nearest', 'Oversize', 'Undersize')
+DRILL_FILE_NAME = 'drills.csv'
+DRILL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'catalogs', DRILL_FILE_NAME)
+DRILL_COLUMNS = ('D', 'name')
+# the inventory file is checked for changes at most once per this time [s]
+CHECK_INTERVAL = 2.0
+
+# (path, mtime, size, drills, keys) of the loaded inventory
+_inventory = None
+# time.monotonic() of the last check of the inventory file
+_lastCheck = 0.0
+# bias -> ((generation, inventory signature), {thread name: Drill or None})
+_stock = {}
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Inventory file                                         |
+# |                                                        |
+# +--------------------------------------------------------+
+def parseDrillFile(path):
+    """
+    parseDrillFile(path) -> list of Drill sorted by diameter
+
+    Parse drill inventory in csv format (see catalogs/drills.csv). Empty
+    lines and lines starting with '#' are ignored, an empty name is
+    replaced by the diameter. Duplicate diameters are dropped.
+    Raises ValueError on a malformed line.
+    """
+    drills = {}
+    header = None
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        # Names contain '"' (e.g. 1/4"), quoting is not used
+        for row in csv.reader(f, quoting=csv.QUOTE_NONE):
+            if (len(row) == 0) or row[0].startswith('#'):
+                continue
+            if header is None:
+                header = tuple(x.strip() for x in row)
+                if header != DRILL_COLUMNS:
+                    raise ValueError('%s - unexpected header %s' % (path, row))
+                continue
+            if len(row) != len(DRILL_COLUMNS):
+                raise ValueError('%s - malformed line %s' % (path, row))
+            try:
+                D = float(row[0])
+            except ValueError:
+                raise ValueError('%s - malformed line %s' % (path, row))
+            if D <= 0.0:
+                raise ValueError('%s - drill diameter has to be positive %s' % (path, row))
+            name = row[1].strip() or ('%g' % D)
+            drills.setdefault(D, Drill(D, name))
+    return [drills[D] for D in sorted(drills)]
+
+def drillFile():
+    """
+    drillFile() -> path of the drill inventory in use
+
+    CT3D_DRILL_INVENTORY if it is set, drills.csv in the user catalog
+    directory if it exists, the built-in catalogs/drills.csv otherwise.
+    """
+    path = os.environ.get('CT3D_DRILL_INVENTORY')
+    if path:
+        return path
+    d = ct3d_catalog.userCatalogDir()
+    if d:
+        path = os.path.join(d, DRILL_FILE_NAME)
+        if os.path.isfile(path):
+            return path
+    return DRILL_FILE
+
+def getInventory():
+    """
+    getInventory() -> list of Drill sorted by diameter
+
+    Drill inventory, the file is parsed again only if it was changed
+    (modification time or size). The file is checked at most once per
+    CHECK_INTERVAL seconds. Do not modify the returned object.
+    Raises OSError or ValueError if the file can not be read.
+    """
+    global _inventory, _lastCheck
+    now = time.monotonic()
+    if (_inventory is not None) and (now - _lastCheck < CHECK_INTERVAL):
+        return _inventory[3]
+    path = drillFile()
+    st = os.stat(path)
+    if (_inventory is None) or \
+       (_inventory[:3] != (path, st.st_mtime_ns, st.st_size)):
+        drills = parseDrillFile(path)
+        _inventory = (path, st.st_mtime_ns, st.st_size,
+                      drills, [x.D for x in drills])
+    _lastCheck = now
+    return _inventory[3]
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Stock drill search                                     |
+# |                                                        |
+# +--------------------------------------------------------+
+def nearestDrill(D_drill, bias='Nearest'):
+    """
+    nearestDrill(D_drill, bias='Nearest') -> Drill or None
+
+    Stocked drill for the pre-drilled hole diameter D_drill [mm]. None if
+    D_drill is not defined (<= 0) or there is no drill on the bias side.
+    Raises ValueError for unknown bias.
+    """
+    if bias not in BIASES:
+        raise ValueError('Unknown drill bias: %r' % bias)
+    drills = getInventory()
+    keys = _inventory[4]
+    if (D_drill <= 0.0) or (len(keys) == 0):
+        return None
+    i = bisect.bisect_left(keys, D_drill) # keys[i-1] < D_drill <= keys[i]
+    if (i < len(keys)) and (keys[i] == D_drill):
+        return drills[i]
+    over = drills[i] if i < len(keys) else None
+    under = drills[i-1] if i > 0 else None
+    if bias == 'Oversize':
+        return over
+    if bias == 'Undersize':
+        return under
+    # 1e-9 - ties of decimal sizes (8.95 between 8.9 and 9.0) go oversize
+    if (over is None) or \
+       ((under is not None) and (D_drill - under.D < over.D - D_drill - 1e-9)):
+        return under
+    return over
+
+def getStockDrills(bias='Nearest'):
+    """
+    getStockDrills(bias='Nearest') -> dictionary thread name -> Drill or None
+
+    Stocked drills of all catalog threads (first family wins for equal
+    names), computed once per catalogs and inventory state and bias.
+    """
+    drills = getInventory()
+    state = (ct3d_catalog.getGeneration(), _inventory[:3])
+    cached = _stock.get(bias)
+    if (cached is not None) and (cached[0] == state):
+        rslt = cached[1]
+    else:
+        rslt = {}
+        for family, title in ct3d_catalog.getFamilies():
+            lthr = ct3d_catalog.getCatalog(family)
+            i = 0
+            rec = lthr.getRecordByIndex(i)
+            while rec is not None:
+                if rec.name not in rslt:
+                    rslt[rec.name] = nearestDrill(rec.D_drill, bias)
+                i += 1
+                rec = lthr.getRecordByIndex(i)
+        _stock[bias] = (state, rslt) # the last state of each bias only
+    return rslt
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_engagement.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Minimum length of thread engagement for a material pairing.
+
+The length is the one where stripping of the internal thread needs the
+same force as breaking the external thread (Machinery's Handbook):
+
+    Le = 2 As / (pi D1 (1/2 + 0.57735 (d2 - D1) / P))
+    As = pi/4 (D - 0.9382 P)^2       tensile stress area
+    d2 = D - 0.649519 P              pitch diameter
+    D1 = D - 1.082532 P              minor diameter of the internal thread
+
+If the internal thread material is weaker than the external one, Le is
+multiplied by the strength ratio Rm(external) / Rm(internal). Basic
+diameters are used, the result is the theoretical minimum.
+
+Sequences of threads are evaluated in one vectorized pass (numpy if
+available, imported on the first such pass), results of documents are
+memoized (LRU) per (D, pitch, strength ratio), equal threads cost one
+lookup - see checkDocument() and minEngagement().
+
+This module does not import FreeCAD.
+"""
+
+import collections
+import functools
+import math
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# Ultimate tensile strength Rm [MPa] of common materials
+MATERIALS = {
+    'steel 4.6': 400.0,
+    'steel 5.6': 500.0,
+    'steel 8.8': 800.0,
+    'steel 10.9': 1000.0,
+    'steel 12.9': 1200.0,
+    'stainless A2-70': 700.0,
+    'stainless A4-80': 800.0,
+    'steel S235': 360.0,
+    'steel S355': 470.0,
+    'steel C45': 650.0,
+    'cast iron GJL-250': 250.0,
+    'cast iron GJS-400': 400.0,
+    'aluminium AlMg3': 230.0,
+    'aluminium 6061-T6': 310.0,
+    'aluminium 7075-T6': 570.0,
+    'brass CuZn39Pb3': 430.0,
+    'bronze CuSn8': 450.0,
+    'titanium Ti6Al4V': 900.0,
+}
+
+# Result of checkDocument() for one thread feature
+EngagementCheck = collections.namedtuple('EngagementCheck',
+                                         ('obj', 'designation', 'length',
+                                          'required', 'ok'))
+
+# number of different (D, pitch, strength ratio) kept by _engagement()
+CACHE_SIZE = 1024
+
+# numpy module, imported by _getNumpy() on the first vectorized pass
+# (False - not tried yet, None - not available). numpy is optional,
+# calcEngagement() uses plain python loop without it.
+_numpy = False
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Calculation                                            |
+# |                                                        |
+# +--------------------------------------------------------+
+def _strength(material):
+    """
+    _strength(material) -> Rm [MPa]
+
+    Internal function. material is a name from MATERIALS or a number.
+    Raises KeyError for unknown material name.
+    """
+    if isinstance(material, (int, float)):
+        return float(material)
+    return MATERIALS[material]
+
+def _getNumpy():
+    """
+    _getNumpy() -> numpy module or None
+
+    Internal function. numpy is imported on the first use only, the CLI
+    and the server start without it.
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+def calcEngagement(D, pitch, ratio=1.0):
+    """
+    calcEngagement(D, pitch, ratio=1.0) -> Le or list of Le [mm]
+
+    Minimum length of engagement. D, pitch and ratio (strength of external
+    / internal thread material, values < 1 count as 1) are numbers or
+    sequences of the same length - all of them are evaluated in one
+    vectorized pass then. Zero for zero pitch or diameter.
+    """
+    scalar = not hasattr(D, '__len__')
+    if scalar:
+        D, pitch, ratio = [D], [pitch], [ratio]
+        numpy = None # one value - no numpy overhead
+    else:
+        if not hasattr(ratio, '__len__'):
+            ratio = [ratio] * len(D)
+        numpy = _getNumpy()
+    if numpy is not None:
+        D = numpy.asarray(D, dtype=numpy.float64)
+        P = numpy.asarray(pitch, dtype=numpy.float64)
+        ratio = numpy.maximum(numpy.asarray(ratio, dtype=numpy.float64), 1.0)
+        valid = (D > 0.0) & (P > 0.0)
+        P = numpy.where(valid, P, 1.0)
+        As = 0.25 * math.pi * (D - 0.9382 * P)**2
+        d2 = D - 0.649519 * P
+        D1 = D - 1.082532 * P
+        Le = 2.0 * As / (math.pi * D1 * (0.5 + 0.57735 * (d2 - D1) / P)) * ratio
+        rslt = [round(float(x), 3) for x in numpy.where(valid, Le, 0.0)]
+    else:
+        rslt = []
+        for d, P, r in zip(D, pitch, ratio):
+            if (d <= 0.0) or (P <= 0.0):
+                rslt.append(0.0)
+                continue
+            As = 0.25 * math.pi * (d - 0.9382 * P)**2
+            d2 = d - 0.649519 * P
+            D1 = d - 1.082532 * P
+            Le = 2.0 * As / (math.pi * D1 * (0.5 + 0.57735 * (d2 - D1) / P))
+            rslt.append(round(Le * max(r, 1.0), 3))
+    return rslt[0] if scalar else rslt
+
+def minEngagement(threads, external='steel 8.8', internal='steel S235'):
+    """
+    minEngagement(threads, external='steel 8.8', internal='steel S235')
+        -> list of Le [mm]
+
+    threads is a sequence of (designation, D, pitch). Materials of
+    the external (bolt) and internal (nut, part) thread are names from
+    MATERIALS or Rm [MPa]. Results are memoized (LRU, CACHE_SIZE
+    entries), see _engagement().
+    """
+    ratio = _strength(external) / _strength(internal)
+    return [_engagement(round(D, 4), round(pitch, 4), ratio)
+            for name, D, pitch in threads]
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _engagement(D, pitch, ratio):
+    """
+    _engagement(D, pitch, ratio) -> Le [mm]
+
+    Internal function, memoized. See calcEngagement().
+    """
+    return calcEngagement(D, pitch, ratio)
+
+def cacheInfo():
+    """
+    cacheInfo() -> (hits, misses, maxsize, currsize)
+
+    Statistics of the engagement cache.
+    """
+    return _engagement.cache_info()
+
+def clearCache():
+    """
+    clearCache() -> None. Drop the cached lengths.
+    """
+    _engagement.cache_clear()
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | checkDocument() - all threads of a document            |
+# |                                                        |
+# +--------------------------------------------------------+
+def isThread(obj):
+    """
+    isThread(obj) -> bool
+
+    obj is a Cosmetic Thread 3D feature (Part or PartDesign, internal or
+    external).
+    """
+    proxy = getattr(obj, 'Proxy', None)
+    return str(getattr(proxy, 'Type', '')).startswith('CosmeticThread3D')
+
+def checkDocument(doc, external='steel 8.8', internal='steel S235'):
+    """
+    checkDocument(doc, external='steel 8.8', internal='steel S235')
+        -> list of EngagementCheck
+
+    Minimum engagement length of every cosmetic thread of the document
+    (or of any sequence of objects) for the material pairing. ok is False
+    if the thread length is shorter. Through threads are checked too -
+    the length is the material thickness there.
+    """
+    objs = doc.Objects if hasattr(doc, 'Objects') else doc
+    objs = [obj for obj in objs if isThread(obj)]
+    threads = [(obj.Description, obj.D.Value, obj.pitch.Value) for obj in objs]
+    required = minEngagement(threads, external, internal)
+    rslt = []
+    for obj, thr, Le in zip(objs, threads, required):
+        length = obj.length.Value
+        rslt.append(EngagementCheck(obj, thr[0], length, Le, length >= Le))
+    return rslt
+
+def shortThreads(doc, external='steel 8.8', internal='steel S235'):
+    """
+    shortThreads(doc, external='steel 8.8', internal='steel S235')
+        -> list of EngagementCheck
+
+    Threads of checkDocument() shorter than the minimum engagement.
+    """
+    return [x for x in checkDocument(doc, external, internal) if not x.ok]
@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_geometry.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Geometry of the cosmetic threads - helix and circles of the thread ends
+in the local coordinate system of the feature.
+
+Long or fine threads have thousands of helix turns. The helix display
+(level of detail) of the feature (helix_lod property) or of the whole
+document (see setDocumentLOD()) shows the full helix, first and last
+turns only, one turn marker or no helix. It changes the shape only,
+thread data are the same.
+
+Shapes are cached (LRU) by their parameters, so the features with equal
+threads (48 studs of a flange) share one shape, each feature places its
+copy by its own Placement. Cache statistics are available by cacheInfo().
+
+Lightweight features (lightweight property) have an empty shape, their
+view providers draw polylines of the same geometry - see internalLines()
+and externalLines().
+"""
+
+import functools
+import math
+
+import FreeCAD as App
+import Part
+import ct3d_params
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Helix display - level of detail                        |
+# |                                                        |
+# +--------------------------------------------------------+
+# keys of doc.Meta with the document setting
+META_LOD = 'CosmeticThread3D_helix_lod'
+META_END_TURNS = 'CosmeticThread3D_helix_end_turns'
+# display of the documents without the setting
+DEFAULT_LOD = 'Full'
+DEFAULT_END_TURNS = 2
+
+def getDocumentLOD(doc):
+    """
+    getDocumentLOD(doc) -> (lod, end_turns)
+
+    Helix display of the document - one of ct3d_params.HELIX_LOD except
+    'Document' - and number of turns at each end for 'End turns'.
+    """
+    meta = doc.Meta if doc is not None else {}
+    lod = meta.get(META_LOD, DEFAULT_LOD)
+    if (lod not in ct3d_params.HELIX_LOD) or (lod == 'Document'):
+        lod = DEFAULT_LOD
+    try:
+        turns = int(meta.get(META_END_TURNS, DEFAULT_END_TURNS))
+    except ValueError:
+        turns = DEFAULT_END_TURNS
+    return (lod, turns)
+
+def setDocumentLOD(doc, lod, end_turns=None):
+    """
+    setDocumentLOD(doc, lod, end_turns=None) -> None
+
+    Store the helix display of the document (in doc.Meta, it is saved
+    with the document) and mark the geometry of threads with helix_lod
+    'Document' changed.
+    """
+    if (lod not in ct3d_params.HELIX_LOD) or (lod == 'Document'):
+        raise ValueError('Unknown helix display: %r' % lod)
+    meta = doc.Meta
+    meta[META_LOD] = lod
+    if end_turns is not None:
+        meta[META_END_TURNS] = str(int(end_turns))
+    doc.Meta = meta
+    for obj in doc.Objects:
+        if getattr(obj, 'helix_lod', None) == 'Document':
+            proxy = getattr(obj, 'Proxy', None)
+            if hasattr(proxy, 'changed'):
+                # unknown changes - the shape key is checked
+                proxy.changed = None
+            obj.touch()
+
+def helixLOD(obj):
+    """
+    helixLOD(obj) -> (lod, end_turns)
+
+    Helix display of the thread feature obj, 'Document' is resolved by
+    the document setting.
+    """
+    lod = getattr(obj, 'helix_lod', 'Document')
+    if lod == 'Document':
+        return getDocumentLOD(obj.Document)
+    return (lod, getattr(obj, 'helix_end_turns', DEFAULT_END_TURNS))
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Shape cache                                            |
+# |                                                        |
+# +--------------------------------------------------------+
+# number of different thread shapes kept in memory
+CACHE_SIZE = 256
+
+def _helix(pitch, length, D_helix, lod, end_turns):
+    """
+    _helix(pitch, length, D_helix, lod, end_turns) -> list of Part.Shape
+
+    Internal function. Helix of the thread by the display lod.
+    """
+    if lod == 'None':
+        return []
+    if lod == 'Marker':
+        return [Part.makeHelix(pitch, min(pitch, length), 0.5*D_helix)]
+    if lod == 'End turns':
+        # first turns, last turns in the phase of the full helix
+        height = end_turns * pitch
+        start = Part.makeHelix(pitch, height, 0.5*D_helix)
+        end = Part.makeHelix(pitch, height, 0.5*D_helix)
+        end.rotate(App.Vector(0, 0, 0), App.Vector(0, 0, 1),
+                   360.0 * ((length - height) / pitch % 1.0))
+        end.translate(App.Vector(0, 0, length - height))
+        return [start, end]
+    return [Part.makeHelix(pitch, length, 0.5*D_helix)]
+
+def _normalizeLOD(pitch, length, lod, end_turns):
+    """
+    _normalizeLOD(pitch, length, lod, end_turns) -> (lod, end_turns)
+
+    Internal function. Cache key normalization - 'End turns' overlapping
+    each other are the full helix, end_turns matter for 'End turns' only.
+    """
+    if lod == 'End turns':
+        end_turns = max(1, end_turns)
+        if 2 * end_turns * pitch >= length:
+            lod = 'Full'
+    if lod != 'End turns':
+        end_turns = 0
+    return (lod, end_turns)
+
+def _shape(pitch, length, D_helix, D_ends, D_end, lod, end_turns):
+    """
+    _shape(pitch, length, D_helix, D_ends, D_end, lod, end_turns) -> Part.Shape
+
+    Internal function. Cached shape of the normalized parameters.
+    """
+    return _buildShape(pitch, length, D_helix, D_ends, D_end,
+                       *_normalizeLOD(pitch, length, lod, end_turns))
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _buildShape(pitch, length, D_helix, D_ends, D_end, lod, end_turns):
+    """
+    _buildShape(pitch, length, D_helix, D_ends, D_end, lod, end_turns) -> Part.Shape
+
+    Internal function, memoized. Helix of diameter D_helix (displayed by
+    lod and end_turns), circles of diameter D_ends at z = 0 and
+    z = length, circle of diameter D_end at z = length (thread not
+    through, None otherwise).
+    The shape is shared - do not change it.
+    """
+    # helix
+    geo = _helix(pitch, length, D_helix, lod, end_turns)
+    # thread diameter at z = 0
+    geo.append(Part.makeCircle(0.5*D_ends))
+    # thread diameter at z = length
+    tmp = Part.makeCircle(0.5*D_ends)
+    tmp.Placement.translate(App.Vector(0, 0, length))
+    geo.append(tmp)
+    if D_end is not None:
+        # the other diameter at z = length
+        tmp = Part.makeCircle(0.5*D_end)
+        tmp.Placement.translate(App.Vector(0, 0, length))
+        geo.append(tmp)
+    return Part.makeCompound(geo)
+
+@functools.lru_cache(maxsize=1)
+def _emptyShape():
+    """
+    _emptyShape() -> Part.Shape
+
+    Internal function. Empty compound of the lightweight features,
+    shared as the thread shapes.
+    """
+    return Part.makeCompound([])
+
+def cacheInfo():
+    """
+    cacheInfo() -> (hits, misses, maxsize, currsize)
+
+    Statistics of the shape cache.
+    """
+    return _buildShape.cache_info()
+
+def clearCache():
+    """
+    clearCache()
+
+    Drop all cached shapes and lines and reset the statistics.
+    """
+    _buildShape.cache_clear()
+    _buildLines.cache_clear()
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Thread shapes                                          |
+# |                                                        |
+# +--------------------------------------------------------+
+def internalShapeKey(obj):
+    """
+    internalShapeKey(obj) -> tuple
+
+    Parameters of the shape of the internal thread feature obj, see
+    internalShape(). Equal keys give the same shape, the features keep
+    the key of their shape to skip the rebuild on recompute.
+    """
+    if getattr(obj, 'lightweight', False):
+        return ()
+    D_end = None if obj.length_through else obj.D1.Value
+    return (obj.pitch.Value, obj.length.Value,
+            obj.D1.Value, obj.D.Value, D_end) + tuple(helixLOD(obj))
+
+def externalShapeKey(obj):
+    """
+    externalShapeKey(obj) -> tuple
+
+    Parameters of the shape of the external thread feature obj, see
+    externalShape() and internalShapeKey().
+    """
+    if getattr(obj, 'lightweight', False):
+        return ()
+    D_end = None if obj.length_through else obj.D.Value
+    return (obj.pitch.Value, obj.length.Value,
+            obj.D.Value, obj.d3.Value, D_end) + tuple(helixLOD(obj))
+
+def shapeOfKey(key):
+    """
+    shapeOfKey(key) -> Part.Shape
+
+    Shared shape of the key made by internalShapeKey() or
+    externalShapeKey(). Empty key is the empty shape of lightweight
+    threads.
+    """
+    if len(key) == 0:
+        return _emptyShape()
+    return _shape(*key)
+
+def internalShape(obj):
+    """
+    internalShape(obj) -> Part.Shape
+
+    Geometry of the internal thread feature obj - helix on the minor
+    diameter D1 (by the helix display), major diameter D at both ends,
+    minor diameter D1 at the end of the not through thread.
+    The shape is shared by equal threads - do not change it, not even
+    its Placement. Part::Feature places the copy in obj.Shape by
+    obj.Placement. Lightweight threads get an empty shape.
+    """
+    return shapeOfKey(internalShapeKey(obj))
+
+def externalShape(obj):
+    """
+    externalShape(obj) -> Part.Shape
+
+    Geometry of the external thread feature obj - helix on the major
+    diameter D (by the helix display), minor diameter d3 at both ends,
+    major diameter D at the end of the not through thread.
+    The shape is shared by equal threads - do not change it, not even
+    its Placement. Part::Feature places the copy in obj.Shape by
+    obj.Placement. Lightweight threads get an empty shape.
+    """
+    return shapeOfKey(externalShapeKey(obj))
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Thread lines - lightweight display                     |
+# |                                                        |
+# +--------------------------------------------------------+
+# polyline segments of one helix turn or circle
+SEGMENTS = 24
+
+def _helixPoints(pitch, z0, z1, radius):
+    """
+    _helixPoints(pitch, z0, z1, radius) -> list of (x, y, z)
+
+    Internal function. Polyline of the helix from z0 to z1, the phase of
+    the helix starting at z = 0.
+    """
+    n = max(1, int(math.ceil((z1 - z0) / pitch * SEGMENTS)))
+    step = (z1 - z0) / n
+    points = []
+    for i in range(n + 1):
+        z = z0 + i * step
+        angle = 2.0 * math.pi * z / pitch
+        points.append((radius * math.cos(angle), radius * math.sin(angle), z))
+    return points
+
+def _circlePoints(z, radius):
+    """
+    _circlePoints(z, radius) -> list of (x, y, z)
+
+    Internal function. Closed polyline of the circle at z.
+    """
+    return [(radius * math.cos(2.0 * math.pi * i / SEGMENTS),
+             radius * math.sin(2.0 * math.pi * i / SEGMENTS), z)
+            for i in range(SEGMENTS + 1)]
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _buildLines(pitch, length, D_helix, D_ends, D_end, lod, end_turns):
+    """
+    _buildLines(pitch, length, D_helix, D_ends, D_end, lod, end_turns)
+        -> (points, counts)
+
+    Internal function, memoized. Polylines of the geometry _buildShape()
+    makes from the same parameters.
+    """
+    lines = []
+    r = 0.5*D_helix
+    if (pitch > 0.0) and (length > 0.0):
+        if lod == 'Full':
+            lines.append(_helixPoints(pitch, 0.0, length, r))
+        elif lod == 'Marker':
+            lines.append(_helixPoints(pitch, 0.0, min(pitch, length), r))
+        elif lod == 'End turns':
+            height = end_turns * pitch
+            lines.append(_helixPoints(pitch, 0.0, height, r))
+            lines.append(_helixPoints(pitch, length - height, length, r))
+    lines.append(_circlePoints(0.0, 0.5*D_ends))
+    lines.append(_circlePoints(length, 0.5*D_ends))
+    if D_end is not None:
+        lines.append(_circlePoints(length, 0.5*D_end))
+    points = tuple(p for line in lines for p in line)
+    counts = tuple(len(line) for line in lines)
+    return (points, counts)
+
+def _lines(pitch, length, D_helix, D_ends, D_end, lod, end_turns):
+    """
+    _lines(pitch, length, D_helix, D_ends, D_end, lod, end_turns)
+        -> (points, counts)
+
+    Internal function. Cached polylines of the normalized parameters.
+    """
+    return _buildLines(pitch, length, D_helix, D_ends, D_end,
+                       *_normalizeLOD(pitch, length, lod, end_turns))
+
+def internalLines(obj):
+    """
+    internalLines(obj) -> (points, counts)
+
+    Polylines of the internal thread feature obj in its local coordinate
+    system - points (x, y, z) of all lines and number of points of each
+    line (SoCoordinate3 and SoLineSet of the view provider).
+    """
+    D_end = None if obj.length_through else obj.D1.Value
+    return _lines(obj.pitch.Value, obj.length.Value,
+                  obj.D1.Value, obj.D.Value, D_end, *helixLOD(obj))
+
+def externalLines(obj):
+    """
+    externalLines(obj) -> (points, counts)
+
+    Polylines of the external thread feature obj, see internalLines().
+    """
+    D_end = None if obj.length_through else obj.D.Value
+    return _lines(obj.pitch.Value, obj.length.Value,
+                  obj.D.Value, obj.d3.Value, D_end, *helixLOD(obj))
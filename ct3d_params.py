@@ -32,7 +32,8 @@ Parameters of internal and external threads. This is common for Part and
 
 
 import os
-import Part
+import ct3d_drill
+import ct3d_tolerance
 
 
 
@@ -86,6 +87,9 @@ class ct3di_params_class:
         #                     #     (used for helix and thread stop)
         self.D_drill = 8.5    # [float - mm] Recommended pre-driled
         #                     #     hole diameter
+        self.D_drill_bias = 'Nearest' # [string] Stock drill selection
+        #                             #     'Nearest', 'Oversize' or
+        #                             #     'Undersize'
         self.tolerance = '6H' # [string]     Hole thread tolerance
         #                     #     (empty string allowed)
         self.roughness = 'Ra 1.6'   # [string]     Hole thread roughness
@@ -97,92 +101,12 @@ class ct3di_params_class:
         self.length_tol = 'H17'     # [string]     Length tolerance
         #                           #     (empty string allowed). For example
         #                           #     "H17" or "0/+1.8" or ""
-
-
-
-# +--------------------------------------------------------+
-# |                                                        |
-# | addProperty_internal_thread()                          |
-# |                                                        |
-# +--------------------------------------------------------+
-def addProperty_internal_thread(obj, ct3di_params):
-    """
-    addProperty_internal_thread(obj, ct3di_params) -> None.
-    This function adds property into obj.
-    This function is common for all internal threads types and variants.
-    """
-
-    # Description - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'Description', \
-                    'Base', \
-                    'Thread designation.', \
-                    0).Description = ct3di_params.name
-    # D nominal - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'D_nominal', \
-                    'ct3di_data', \
-                    'Nominal diameter.', \
-                    0).D_nominal = ct3di_params.D_nominal
-    # Pitch - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'pitch', \
-                    'ct3di_data', \
-                    'Thread pitch.', \
-                    0).pitch = ct3di_params.pitch
-    # TPI - Read and Write
-    obj.addProperty('App::PropertyFloat', \
-                    'TPI', \
-                    'ct3di_data', \
-                    'Threads Per Inch.', \
-                    0).TPI = ct3di_params.TPI
-    # Major diameter - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'D', \
-                    'ct3di_data', \
-                    'Thread major diameter.', \
-                    0).D = ct3di_params.D
-    # Minor diameter - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'D1', \
-                    'ct3di_data', \
-                    'Thread minor diameter.', \
-                    0).D1 = ct3di_params.D1
-    # Pre drilled recomendation - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'D_drill', 'ct3di_data', \
-                    'Recommended pre-driled hole diameter.', \
-                    0).D_drill = ct3di_params.D_drill
-    # Thread tolerance - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'tolerance', \
-                    'ct3di_data', \
-                    'Hole thread tolerance. For example "6H" or nothing.', \
-                    0).tolerance = ct3di_params.tolerance
-    # Roughness - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'roughness', \
-                    'ct3di_data', \
-                    'Hole thread roughness. For example "Ra 1.6" or "Rz 2" or nothing.', \
-                    0).roughness = ct3di_params.roughness
-    # Length of thread - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'length', \
-                    'ct3di_data', \
-                    'Thread length.', \
-                    0).length = ct3di_params.length
-    # Is the thread throught? - Read and Write
-    obj.addProperty('App::PropertyBool', \
-                    'length_through', \
-                    'ct3di_data', \
-                    'Thread is through whole body?', \
-                    0).length_through = ct3di_params.length_through
-    # Length tolerance - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'length_tol', \
-                    'ct3di_data', \
-                    'Length tolerance. For example "H17" or "0/+1.8" or nothing.', \
-                    0).length_tol = ct3di_params.length_tol
+        self.helix_lod = 'Document' # [string]     Helix display, see
+        #                           #     HELIX_LOD
+        self.helix_end_turns = 2    # [int]        Turns at each end for
+        #                           #     helix_lod 'End turns'
+        self.lightweight = False    # [Bool]       Lines drawn by the view
+        #                           #     provider, shape is empty
 
 
 
@@ -211,6 +135,197 @@ class ct3de_params_class:
         self.length = 18.0
         self.length_through = False
         self.length_tol = 'H17'
+        self.helix_lod = 'Document'
+        self.helix_end_turns = 2
+        self.lightweight = False
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Property schema of internal and external threads       |
+# |                                                        |
+# +--------------------------------------------------------+
+# Helix display (level of detail) - the whole helix, first and last
+# helix_end_turns turns, one turn at the thread start, no helix.
+# 'Document' takes the document setting, see ct3d_geometry.helixLOD().
+HELIX_LOD = ('Document', 'Full', 'End turns', 'Marker', 'None')
+
+# Limit diameters - (property, ThreadLimits field, description)
+LIMITS_INTERNAL = (('D_min', 'major_min', 'Major diameter min.'),
+                   ('D_max', 'major_max', 'Major diameter max (follows D2 tolerance).'),
+                   ('D2_min', 'pitch_min', 'Pitch diameter min.'),
+                   ('D2_max', 'pitch_max', 'Pitch diameter max.'),
+                   ('D1_min', 'minor_min', 'Minor diameter min.'),
+                   ('D1_max', 'minor_max', 'Minor diameter max.'))
+LIMITS_EXTERNAL = (('d_min', 'major_min', 'Major diameter min.'),
+                   ('d_max', 'major_max', 'Major diameter max.'),
+                   ('d2_min', 'pitch_min', 'Pitch diameter min.'),
+                   ('d2_max', 'pitch_max', 'Pitch diameter max.'),
+                   ('d3_min', 'minor_min', 'Minor diameter min (follows d2 tolerance).'),
+                   ('d3_max', 'minor_max', 'Minor diameter max.'))
+
+# One row per property, in the order they are added:
+# (kind, type, name, group, description, mode, source)
+# kind   - 'i' internal thread, 'e' external thread, 'ie' both
+# group  - 'Base' or 'data' / 'limits' / 'display' (ct3di_data,
+#          ct3de_limits, ...)
+# mode   - 0 Read and Write, 1 Read only
+# source - attribute of ct3di_params_class / ct3de_params_class with
+#          the value, None - value is calculated by update functions
+PROPERTY_SCHEMA = (
+    ('ie', 'App::PropertyString', 'Description', 'Base',
+     'Thread designation.', 0, 'name'),
+    ('ie', 'App::PropertyLength', 'D_nominal', 'data',
+     'Nominal diameter.', 0, 'D_nominal'),
+    ('ie', 'App::PropertyLength', 'pitch', 'data',
+     'Thread pitch.', 0, 'pitch'),
+    ('ie', 'App::PropertyFloat', 'TPI', 'data',
+     'Threads Per Inch.', 0, 'TPI'),
+    ('ie', 'App::PropertyLength', 'D', 'data',
+     'Thread major diameter.', 0, 'D'),
+    ('i', 'App::PropertyLength', 'D1', 'data',
+     'Thread minor diameter.', 0, 'D1'),
+    ('e', 'App::PropertyLength', 'd3', 'data',
+     'Thread minor diameter.', 0, 'd3'),
+    ('i', 'App::PropertyLength', 'D_drill', 'data',
+     'Recommended pre-driled hole diameter.', 0, 'D_drill'),
+    ('i', 'App::PropertyEnumeration', 'D_drill_bias', 'data',
+     'Stock drill selection for D_drill - nearest, oversize or undersize.', 0, 'D_drill_bias'),
+    ('i', 'App::PropertyLength', 'D_drill_stock', 'data',
+     'Nearest stocked drill to D_drill (0 = no drill).', 1, None),
+    ('i', 'App::PropertyString', 'D_drill_stock_name', 'data',
+     'Name of the stocked drill in the drill inventory.', 1, None),
+    ('i', 'App::PropertyString', 'tolerance', 'data',
+     'Hole thread tolerance. For example "6H", "2B" or nothing.', 0, 'tolerance'),
+    ('e', 'App::PropertyString', 'tolerance', 'data',
+     'Extenal thread tolerance. For example "6g", "2A" or nothing.', 0, 'tolerance'),
+    ('i', 'App::PropertyString', 'roughness', 'data',
+     'Hole thread roughness. For example "Ra 1.6" or "Rz 2" or nothing.', 0, 'roughness'),
+    ('e', 'App::PropertyString', 'roughness', 'data',
+     'External thread roughness. For example "Ra 1.6" or "Rz 2" or nothing.', 0, 'roughness'),
+    ('ie', 'App::PropertyLength', 'length', 'data',
+     'Thread length.', 0, 'length'),
+    ('ie', 'App::PropertyBool', 'length_through', 'data',
+     'Thread is through whole body?', 0, 'length_through'),
+    ('ie', 'App::PropertyString', 'length_tol', 'data',
+     'Length tolerance. For example "H17" or "0/+1.8" or nothing.', 0, 'length_tol'),
+    ('ie', 'App::PropertyEnumeration', 'helix_lod', 'display',
+     'Helix display - Document setting, Full, End turns, Marker or None.', 0, 'helix_lod'),
+    ('ie', 'App::PropertyInteger', 'helix_end_turns', 'display',
+     'Helix turns shown at each thread end for End turns display.', 0, 'helix_end_turns'),
+    ('ie', 'App::PropertyBool', 'lightweight', 'display',
+     'Thread lines are drawn by the view provider only, the shape is empty.', 0, 'lightweight'),
+) + tuple(('i', 'App::PropertyLength', prop, 'limits', doc, 1, None)
+          for prop, field, doc in LIMITS_INTERNAL) \
+  + tuple(('e', 'App::PropertyLength', prop, 'limits', doc, 1, None)
+          for prop, field, doc in LIMITS_EXTERNAL)
+
+# Items of enumeration properties, the first one is the default
+ENUMERATIONS = {'D_drill_bias': ct3d_drill.BIASES,
+                'helix_lod': HELIX_LOD}
+
+# Properties the thread geometry is made of. Other properties of the
+# schema are thread data (metadata) - their change does not need new
+# geometry. Attachment properties move the geometry only. Other
+# properties out of the schema are geometric.
+GEOMETRY_PROPERTIES = frozenset(('pitch', 'length', 'D', 'D1', 'd3',
+                                 'length_through',
+                                 'helix_lod', 'helix_end_turns',
+                                 'lightweight'))
+METADATA_PROPERTIES = frozenset(('Label', 'Label2', 'Visibility') +
+                                tuple(row[2] for row in PROPERTY_SCHEMA
+                                      if row[2] not in GEOMETRY_PROPERTIES))
+PLACEMENT_PROPERTIES = frozenset(('Placement', 'AttachmentOffset',
+                                  'Support', 'AttachmentSupport',
+                                  'MapMode', 'MapReversed',
+                                  'MapPathParameter', 'AttacherType',
+                                  'AttacherEngine'))
+
+def geometryUpdate(changed):
+    """
+    geometryUpdate(changed) -> 'Shape', 'Placement' or None
+
+    What has the thread feature to update on recompute - the shape, its
+    placement only or nothing (thread data changed only). The placement
+    follows the attachment in all cases. changed is
+    the set of properties changed since the last recompute, None if
+    unknown (new object). Empty set means the feature was touched
+    (touch(), dependencies) - the feature compares the key of its shape
+    (ct3d_geometry.internalShapeKey()) and rebuilds it only if the key
+    changed.
+    """
+    if not changed:
+        return 'Shape'
+    if changed <= METADATA_PROPERTIES:
+        return None
+    if (changed - METADATA_PROPERTIES) <= PLACEMENT_PROPERTIES:
+        return 'Placement'
+    return 'Shape'
+
+# kind -> resolved schema rows (type, name, group, description, mode,
+# source), see getSchema()
+_schemas = {}
+
+def getSchema(kind):
+    """
+    getSchema(kind) -> tuple of (type, name, group, description, mode, source)
+
+    Properties of internal (kind 'i') or external (kind 'e') thread with
+    the full group names.
+    """
+    rows = _schemas.get(kind)
+    if rows is None:
+        prefix = 'ct3di_' if kind == 'i' else 'ct3de_'
+        rows = tuple((ptype, name, group if group == 'Base' else prefix + group,
+                      doc, mode, source)
+                     for kinds, ptype, name, group, doc, mode, source in PROPERTY_SCHEMA
+                     if kind in kinds)
+        _schemas[kind] = rows
+    return rows
+
+def applySchema(obj, kind, prms=None):
+    """
+    applySchema(obj, kind, prms=None) -> list of added property names
+
+    Add all properties of the schema missing in obj in one pass and set
+    them from the parameters object prms (ct3di_params_class or
+    ct3de_params_class), if it is given. The feature classes call it
+    from onDocumentRestored() too - older documents get the new
+    properties with default values when they are opened. The feature classes ignore
+    onChanged() while it runs (their _loading flag).
+    """
+    added = []
+    for ptype, name, group, doc, mode, source in getSchema(kind):
+        if hasattr(obj, name):
+            continue
+        added.append(name)
+        obj.addProperty(ptype, name, group, doc, mode)
+        items = ENUMERATIONS.get(name)
+        if items is not None:
+            setattr(obj, name, list(items))
+            setattr(obj, name, items[0])
+        if (prms is not None) and (source is not None):
+            setattr(obj, name, getattr(prms, source))
+    return added
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | addProperty_internal_thread()                          |
+# |                                                        |
+# +--------------------------------------------------------+
+def addProperty_internal_thread(obj, ct3di_params):
+    """
+    addProperty_internal_thread(obj, ct3di_params) -> None.
+    This function adds property into obj.
+    This function is common for all internal threads types and variants.
+    """
+    applySchema(obj, 'i', ct3di_params)
+    # Limit diameters and stock drill - Read only
+    updateLimits_internal_thread(obj)
+    updateDrill_internal_thread(obj)
 
 
 
@@ -225,70 +340,63 @@ def addProperty_external_thread(obj, ct3de_params):
     This function adds property into obj.
     This function is common for all external threads types and variants.
     """
+    applySchema(obj, 'e', ct3de_params)
+    # Limit diameters - Read only
+    updateLimits_external_thread(obj)
+
 
-    # Description - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'Description', \
-                    'Base', \
-                    'Thread designation.', \
-                    0).Description = ct3de_params.name
-    # D nominal - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'D_nominal', \
-                    'ct3de_data', \
-                    'Nominal diameter.', \
-                    0).D_nominal = ct3de_params.D_nominal
-    # Pitch - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'pitch', \
-                    'ct3de_data', \
-                    'Thread pitch.', \
-                    0).pitch = ct3de_params.pitch
-    # TPI - Read and Write
-    obj.addProperty('App::PropertyFloat', \
-                    'TPI', \
-                    'ct3de_data', \
-                    'Threads Per Inch.', \
-                    0).TPI = ct3de_params.TPI
-    # Major diameter - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'D', \
-                    'ct3de_data', \
-                    'Thread major diameter.', \
-                    0).D = ct3de_params.D
-    # Minor diameter - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'd3', \
-                    'ct3de_data', \
-                    'Thread minor diameter.', \
-                    0).d3 = ct3de_params.d3
-    # Thread tolerance - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'tolerance', \
-                    'ct3de_data', \
-                    'Extenal thread tolerance. For example "6g" or nothing.', \
-                    0).tolerance = ct3de_params.tolerance
-    # Roughness - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'roughness', \
-                    'ct3de_data', \
-                    'External thread roughness. For example "Ra 1.6" or "Rz 2" or nothing.', \
-                    0).roughness = ct3de_params.roughness
-    # Length of thread - Read and Write
-    obj.addProperty('App::PropertyLength', \
-                    'length', \
-                    'ct3de_data', \
-                    'Thread length.', \
-                    0).length = ct3de_params.length
-    # Is the thread throught? - Read and Write
-    obj.addProperty('App::PropertyBool', \
-                    'length_through', \
-                    'ct3de_data', \
-                    'Thread is through whole body?', \
-                    0).length_through = ct3de_params.length_through
-    # Length tolerance - Read and Write
-    obj.addProperty('App::PropertyString', \
-                    'length_tol', \
-                    'ct3de_data', \
-                    'Length tolerance. For example "H17" or "0/+1.8" or nothing.', \
-                    0).length_tol = ct3de_params.length_tol
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Calculated properties - limits, stock drill            |
+# |                                                        |
+# +--------------------------------------------------------+
+def _updateLimits(obj, limits, kind, D1, d3):
+    """
+    _updateLimits(obj, limits, kind, D1, d3) -> None
+
+    Internal function. Fills limits from the tolerance property. Limits
+    are zero if the tolerance class is empty or unknown.
+    """
+    lim = ct3d_tolerance.getThreadLimits(obj.Description, obj.tolerance,
+                                         obj.D.Value, D1, d3, obj.pitch.Value)
+    if (lim is not None) and (lim.internal != (kind == 'i')):
+        lim = None
+    for prop, field, doc in limits:
+        value = 0.0 if lim is None else getattr(lim, field)
+        if getattr(obj, prop).Value != value:
+            setattr(obj, prop, value)
+
+def updateLimits_internal_thread(obj):
+    """
+    updateLimits_internal_thread(obj) -> None.
+    Limit diameters of the internal thread by its tolerance (ISO 965-1
+    or ASME B1.1), see ct3d_tolerance.
+    """
+    _updateLimits(obj, LIMITS_INTERNAL, 'i', obj.D1.Value, obj.D1.Value)
+
+def updateLimits_external_thread(obj):
+    """
+    updateLimits_external_thread(obj) -> None.
+    Limit diameters of the external thread by its tolerance (ISO 965-1
+    or ASME B1.1), see ct3d_tolerance.
+    """
+    _updateLimits(obj, LIMITS_EXTERNAL, 'e', obj.d3.Value, obj.d3.Value)
+
+def updateDrill_internal_thread(obj):
+    """
+    updateDrill_internal_thread(obj) -> None.
+    Stocked drill of the drill inventory for D_drill of the internal
+    thread, see ct3d_drill. Zero if there is no suitable drill or the
+    inventory can not be read.
+    """
+    try:
+        drill = ct3d_drill.nearestDrill(obj.D_drill.Value, obj.D_drill_bias)
+    except (OSError, ValueError):
+        drill = None
+    D = 0.0 if drill is None else drill.D
+    name = '' if drill is None else drill.name
+    if obj.D_drill_stock.Value != D:
+        obj.D_drill_stock = D
+    if obj.D_drill_stock_name != name:
+        obj.D_drill_stock_name = name
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_server.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Local JSON-RPC 2.0 service over the thread catalogs (optional).
+
+    python ct3d_server.py                       # TCP 127.0.0.1:8765
+    python ct3d_server.py --port 9000
+    python ct3d_server.py --unix /tmp/ct3d.sock
+
+One JSON request (or a batch - JSON array of requests) per line, one
+response line per request line. Requests of one connection may be sent
+without waiting for responses (pipelining), responses come in the same
+order. Many clients are served concurrently by asyncio, all of them
+share one loaded and indexed catalog layer.
+
+Methods (params by name or by position):
+    lookup(designation, family=None)   -> thread (see ct3d_cli.FIELDS)
+    bestFit(D, internal=True, k=5)     -> list of threads with 'deviance'
+    parse(text)                        -> {'key': parseKey(), 'thread': ...}
+    byPitch(pitch, tol=0.005), byTPI(TPI, tol=0.05) -> list of threads
+    families()                         -> list of [family, title]
+
+Example:
+    {"jsonrpc": "2.0", "id": 1, "method": "lookup", "params": ["M10"]}
+
+This module does not import FreeCAD.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import stat
+import sys
+import time
+
+import ct3d_catalog
+import ct3d_cli
+import ct3d_designation
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+THREAD_ERROR = -32000 # designation or family not found
+
+# the longest request line (a batch)
+LINE_LIMIT = 16 * 1024 * 1024
+# user catalogs are checked for changes at most once per this time [s]
+REFRESH_INTERVAL = 2.0
+
+
+
+class RpcError(Exception):
+    """
+    Error reported to the client as JSON-RPC error object.
+    """
+
+    def __init__(self, code, message):
+        Exception.__init__(self, message)
+        self.code = code
+        self.message = message
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Methods                                                |
+# |                                                        |
+# +--------------------------------------------------------+
+def _text(value, name, optional=False):
+    """
+    _text(value, name, optional=False) -> value
+
+    Internal function. Check the string parameter.
+    """
+    if (value is None) and optional:
+        return value
+    if not isinstance(value, str):
+        raise RpcError(INVALID_PARAMS, '%s has to be a string' % name)
+    return value
+
+def _number(value, name):
+    """
+    _number(value, name) -> float
+
+    Internal function. Check the numeric parameter.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RpcError(INVALID_PARAMS, '%s has to be a number' % name)
+    return float(value)
+
+def _lookup(designation, family=None):
+    """
+    lookup(designation, family=None) -> thread
+    """
+    rslt = ct3d_cli.lookup(_text(designation, 'designation'),
+                           _text(family, 'family', True))
+    if not rslt['name']:
+        raise RpcError(THREAD_ERROR, rslt['error'])
+    return rslt
+
+def _bestFit(D, internal=True, k=5):
+    """
+    bestFit(D, internal=True, k=5) -> list of threads
+    """
+    if not isinstance(internal, bool):
+        raise RpcError(INVALID_PARAMS, 'internal has to be true or false')
+    if isinstance(k, bool) or not isinstance(k, int):
+        raise RpcError(INVALID_PARAMS, 'k has to be an integer')
+    return ct3d_cli.search(_number(D, 'D'), internal, k)
+
+def _parse(text):
+    """
+    parse(text) -> {'key': ..., 'thread': ...}
+    """
+    _text(text, 'text')
+    try:
+        rec = ct3d_designation.parseDesignation(text)
+    except ct3d_designation.DesignationError as e:
+        raise RpcError(THREAD_ERROR, str(e))
+    return {'key': ct3d_designation.parseKey(text),
+            'thread': ct3d_cli.recordToDict(rec, text)}
+
+def _byPitch(pitch, tol=0.005):
+    """
+    byPitch(pitch, tol=0.005) -> list of threads
+    """
+    return [ct3d_cli.recordToDict(rec, str(pitch), deviance=dev)
+            for dev, rec in ct3d_catalog.findByPitch(_number(pitch, 'pitch'),
+                                                     _number(tol, 'tol'))]
+
+def _byTPI(TPI, tol=0.05):
+    """
+    byTPI(TPI, tol=0.05) -> list of threads
+    """
+    return [ct3d_cli.recordToDict(rec, str(TPI), deviance=dev)
+            for dev, rec in ct3d_catalog.findByTPI(_number(TPI, 'TPI'),
+                                                   _number(tol, 'tol'))]
+
+def _families():
+    """
+    families() -> list of [family, title]
+    """
+    return [list(x) for x in ct3d_catalog.getFamilies()]
+
+METHODS = {'lookup': _lookup,
+           'bestFit': _bestFit,
+           'parse': _parse,
+           'byPitch': _byPitch,
+           'byTPI': _byTPI,
+           'families': _families}
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | Request handling                                       |
+# |                                                        |
+# +--------------------------------------------------------+
+_lastRefresh = 0.0
+
+def _refresh():
+    """
+    _refresh() -> None. Reload changed user catalogs, not too often.
+    """
+    global _lastRefresh
+    now = time.monotonic()
+    if now - _lastRefresh >= REFRESH_INTERVAL:
+        _lastRefresh = now
+        ct3d_catalog.refreshUserCatalogs()
+
+def _error(rid, code, message):
+    return {'jsonrpc': '2.0', 'id': rid,
+            'error': {'code': code, 'message': message}}
+
+def handleRequest(req):
+    """
+    handleRequest(req) -> response dictionary or None (notification)
+
+    One decoded JSON-RPC request. Any failure of the request is answered
+    by its error response, the other requests go on.
+    """
+    if not isinstance(req, dict) or not isinstance(req.get('method'), str):
+        return _error(None, INVALID_REQUEST, 'Invalid request')
+    rid = req.get('id')
+    func = METHODS.get(req['method'])
+    try:
+        if func is None:
+            raise RpcError(METHOD_NOT_FOUND, 'Method not found: %s' % req['method'])
+        params = req.get('params', [])
+        try:
+            if isinstance(params, dict):
+                rslt = func(**params)
+            elif isinstance(params, list):
+                rslt = func(*params)
+            else:
+                raise RpcError(INVALID_PARAMS, 'params has to be array or object')
+        except (TypeError, ValueError) as e:
+            raise RpcError(INVALID_PARAMS, str(e))
+        except KeyError as e:
+            raise RpcError(THREAD_ERROR, str(e.args[0]))
+    except RpcError as e:
+        if 'id' not in req:
+            return None
+        return _error(rid, e.code, e.message)
+    except Exception as e:
+        if 'id' not in req:
+            return None
+        return _error(rid, INTERNAL_ERROR, 'Internal error: %s' % e)
+    if 'id' not in req:
+        return None
+    return {'jsonrpc': '2.0', 'id': rid, 'result': rslt}
+
+def handleLine(line):
+    """
+    handleLine(line) -> response line (string, may be empty)
+
+    One request line - single request or batch.
+    """
+    try:
+        data = json.loads(line)
+    except ValueError as e:
+        return json.dumps(_error(None, PARSE_ERROR, 'Parse error: %s' % e))
+    _refresh()
+    if isinstance(data, list):
+        if len(data) == 0:
+            return json.dumps(_error(None, INVALID_REQUEST, 'Empty batch'))
+        rslt = [x for x in (handleRequest(req) for req in data) if x is not None]
+        return json.dumps(rslt) if rslt else ''
+    rslt = handleRequest(data)
+    return '' if rslt is None else json.dumps(rslt)
+
+async def _client(reader, writer):
+    """
+    Serve one connection. Lines are answered in order, the client may
+    send more lines before reading the responses (pipelining).
+    """
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError: # longer than LINE_LIMIT
+                writer.write((json.dumps(_error(None, INVALID_REQUEST,
+                                                'Request too long')) + '\n').encode('utf-8'))
+                break
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            rslt = handleLine(line.decode('utf-8', 'replace'))
+            if rslt:
+                writer.write((rslt + '\n').encode('utf-8'))
+                await writer.drain() # waits only if the client does not read
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+def warmUp():
+    """
+    warmUp() -> None
+
+    Load all catalogs and build the indexes before the first client.
+    """
+    ct3d_catalog.refreshUserCatalogs()
+    for family, title in ct3d_catalog.getFamilies():
+        ct3d_catalog.getCatalog(family)
+    ct3d_catalog.findBestFit(1.0)
+    ct3d_designation._getIndex()
+
+async def serve(host='127.0.0.1', port=8765, unix=None):
+    """
+    serve(host='127.0.0.1', port=8765, unix=None) -> never returns
+
+    Serve on TCP host:port or on the unix socket path unix. A stale
+    socket at unix is removed, any other file there is left alone and
+    ValueError is raised.
+    """
+    if unix is not None:
+        try:
+            st = os.lstat(unix)
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            if not stat.S_ISSOCK(st.st_mode):
+                raise ValueError('%s exists and it is not a socket' % unix)
+            os.remove(unix)
+    warmUp()
+    if unix is not None:
+        server = await asyncio.start_unix_server(_client, unix, limit=LINE_LIMIT)
+    else:
+        server = await asyncio.start_server(_client, host, port, limit=LINE_LIMIT)
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    """
+    main(argv=None) -> exit code
+    """
+    parser = argparse.ArgumentParser(description='Cosmetic Thread 3D catalog JSON-RPC service.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='unix socket path instead of TCP')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    except (OSError, ValueError) as e:
+        print('ct3d_server: %s' % e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,579 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_tolerance.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Thread tolerance engine - turns the tolerance class of the thread ('6H',
+'6g', '5g6g', '2A', '3B') into limit diameters.
+
+Metric threads follow ISO 965-1 (fundamental deviations G, H, e, f, g,
+h and tolerance grades 3..9) - deviations, TD1 and Td are its tables,
+pitch diameter tolerances its formulas rounded to R40 numbers as the
+standard does. Unified threads follow ASME B1.1 formulas (classes 1A,
+2A, 3A, 1B, 2B, 3B, length of engagement equal to the major diameter)
+rounded to 0.0001 in as its tables. Limits are rounded to 0.001 mm.
+The values are spot checked against the published tables, see
+checkPublished().
+
+Limits of catalog threads are cached by (designation, class), so batch
+reports over many threads are dictionary lookups - see getLimits() and
+getFamilyLimits().
+
+Limits not specified by the standards (major diameter max of internal
+thread, minor diameter min of external thread) follow the pitch diameter
+tolerance.
+
+This module does not import FreeCAD.
+"""
+
+import collections
+import functools
+import math
+import re
+
+import ct3d_catalog
+import ct3d_designation
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# Limit diameters of a thread [mm].
+# internal thread: major = D, pitch = D2, minor = D1
+# external thread: major = d, pitch = d2, minor = d3
+ThreadLimits = collections.namedtuple('ThreadLimits',
+                                      ('tolerance', 'internal',
+                                       'major_min', 'major_max',
+                                       'pitch_min', 'pitch_max',
+                                       'minor_min', 'minor_max'))
+
+# H = 0.866025 P, D2 = D - 3/4 H
+_D2_FACTOR = 0.649519
+
+# ISO 965-1 - 6G 6H / 6e 6f 6g 6h, two classes: 5g6g (pitch, major)
+_RE_ISO = re.compile(r'^(\d)([GHefgh])(?:(\d)([GHefgh]))?$')
+# ASME B1.1 - 2A, 3B
+_RE_ASME = re.compile(r'^([123])([AB])$')
+
+# R40 preferred numbers 100..950 - ISO 965-1 rounds tolerances to them
+_R40 = (100, 106, 112, 118, 125, 132, 140, 150, 160, 170,
+        180, 190, 200, 212, 224, 236, 250, 265, 280, 300,
+        315, 335, 355, 375, 400, 425, 450, 475, 500, 530,
+        560, 600, 630, 670, 710, 750, 800, 850, 900, 950)
+
+# ISO 965-1 table - fundamental deviations [um] by pitch [mm]:
+# P: (G, e, f, g), None - not specified, H and h are zero
+_ISO_DEVIATIONS = {
+    0.2: (17, None, None, -17),   0.25: (18, None, None, -18),
+    0.3: (18, None, None, -18),   0.35: (19, None, -34, -19),
+    0.4: (19, None, -34, -19),    0.45: (20, None, -35, -20),
+    0.5: (20, -50, -36, -20),     0.6: (21, -53, -36, -21),
+    0.7: (22, -56, -38, -22),     0.75: (22, -56, -38, -22),
+    0.8: (24, -60, -38, -24),     1.0: (26, -60, -40, -26),
+    1.25: (28, -63, -42, -28),    1.5: (32, -67, -45, -32),
+    1.75: (34, -71, -48, -34),    2.0: (38, -71, -52, -38),
+    2.5: (42, -80, -58, -42),     3.0: (48, -85, -63, -48),
+    3.5: (53, -90, -70, -53),     4.0: (60, -95, -75, -60),
+    4.5: (63, -100, -80, -63),    5.0: (71, -106, -85, -71),
+    5.5: (75, -112, -90, -75),    6.0: (80, -118, -95, -80),
+    8.0: (100, -140, -118, -100)}
+_ISO_POSITIONS = 'Gefg'
+# ISO 965-1 fundamental deviation formulas [um] of pitches out of table
+_ISO_DEVIATION = {'G': lambda P: 15.0 + 11.0 * P,
+                  'H': lambda P: 0.0,
+                  'e': lambda P: -(50.0 + 11.0 * P),
+                  'f': lambda P: -(30.0 + 11.0 * P),
+                  'g': lambda P: -(15.0 + 11.0 * P),
+                  'h': lambda P: 0.0}
+
+# ISO 965-1 table - minor diameter tolerance TD1 [um], grades 4..8
+_ISO_TD1 = {
+    0.2: (38, None, None, None, None),  0.25: (45, 56, None, None, None),
+    0.3: (53, 67, 85, None, None),      0.35: (63, 80, 100, None, None),
+    0.4: (71, 90, 112, None, None),     0.45: (80, 100, 125, None, None),
+    0.5: (90, 112, 140, 180, None),     0.6: (100, 125, 160, 200, None),
+    0.7: (112, 140, 180, 224, None),    0.75: (118, 150, 190, 236, None),
+    0.8: (125, 160, 200, 250, 315),     1.0: (150, 190, 236, 300, 375),
+    1.25: (170, 212, 265, 335, 425),    1.5: (190, 236, 300, 375, 475),
+    1.75: (212, 265, 335, 425, 530),    2.0: (236, 300, 375, 475, 600),
+    2.5: (280, 355, 450, 560, 710),     3.0: (315, 400, 500, 630, 800),
+    3.5: (355, 450, 560, 710, 900),     4.0: (375, 475, 600, 750, 950),
+    4.5: (425, 530, 670, 850, 1060),    5.0: (450, 560, 710, 900, 1120),
+    5.5: (475, 600, 750, 950, 1180),    6.0: (500, 630, 800, 1000, 1250),
+    8.0: (630, 800, 1000, 1250, 1600)}
+_ISO_GRADES_TD1 = (4, 5, 6, 7, 8)
+
+# ISO 965-1 table - major diameter tolerance Td [um], grades 4, 6, 8
+_ISO_TD = {
+    0.2: (36, 56, None),     0.25: (42, 67, None),    0.3: (48, 75, None),
+    0.35: (53, 85, None),    0.4: (60, 95, None),     0.45: (63, 100, None),
+    0.5: (67, 106, None),    0.6: (80, 125, None),    0.7: (90, 140, None),
+    0.75: (90, 140, None),   0.8: (95, 150, 236),     1.0: (112, 180, 280),
+    1.25: (132, 212, 335),   1.5: (150, 236, 375),    1.75: (170, 265, 425),
+    2.0: (180, 280, 450),    2.5: (212, 335, 530),    3.0: (236, 375, 600),
+    3.5: (265, 425, 670),    4.0: (300, 475, 750),    4.5: (315, 500, 800),
+    5.0: (335, 530, 850),    5.5: (355, 560, 900),    6.0: (375, 600, 950),
+    8.0: (450, 710, 1180)}
+_ISO_GRADES_Td = (4, 6, 8)
+
+# ISO 965-1 grade factors to grade 6 of the external pitch diameter
+# tolerance Td2 - for Td2 (grades 3..9) and for TD2 (grades 4..8)
+_ISO_GRADE_Td2 = {3: 0.5, 4: 0.63, 5: 0.8, 6: 1.0, 7: 1.25, 8: 1.6, 9: 2.0}
+_ISO_GRADE_TD2 = {4: 0.85, 5: 1.06, 6: 1.32, 7: 1.7, 8: 2.12}
+# grade factors of TD1 and Td of pitches out of the tables
+_ISO_GRADE = {4: 0.63, 5: 0.8, 6: 1.0, 7: 1.25, 8: 1.6}
+# ISO 965-1 basic major diameter ranges [mm] for Td2
+_ISO_RANGES = (0.99, 1.4, 2.8, 5.6, 11.2, 22.4, 45.0, 90.0, 180.0, 355.0, 600.0)
+
+# ASME B1.1 pitch diameter tolerance factors, class 2A = 1
+_ASME_FACTOR = {'1A': 1.5, '2A': 1.0, '3A': 0.75,
+                '1B': 1.95, '2B': 1.3, '3B': 0.975}
+
+# Published limits for spot checks, see checkPublished():
+# ((tolerance, D, D1, d3, pitch [mm]), unit, {ThreadLimits field: value})
+# ISO 965-2 (M6, M8, M10, M12, M16, M20) in mm, ASME B1.1 (1/4-20,
+# 1/2-13 UNC) in inches
+PUBLISHED = (
+    (('6H', 10.0, 8.376, 8.16, 1.5), 'mm',
+     {'pitch_min': 9.026, 'pitch_max': 9.206,
+      'minor_min': 8.376, 'minor_max': 8.676}),
+    (('6g', 10.0, 8.376, 8.16, 1.5), 'mm',
+     {'major_min': 9.732, 'major_max': 9.968,
+      'pitch_min': 8.862, 'pitch_max': 8.994}),
+    (('6H', 6.0, 4.917, 4.773, 1.0), 'mm',
+     {'pitch_max': 5.5, 'minor_max': 5.153}),
+    (('6g', 6.0, 4.917, 4.773, 1.0), 'mm',
+     {'major_min': 5.794, 'major_max': 5.974,
+      'pitch_min': 5.212, 'pitch_max': 5.324}),
+    (('6H', 8.0, 6.647, 6.466, 1.25), 'mm',
+     {'pitch_max': 7.348, 'minor_max': 6.912}),
+    (('6g', 8.0, 6.647, 6.466, 1.25), 'mm',
+     {'major_min': 7.76, 'pitch_min': 7.042, 'pitch_max': 7.16}),
+    (('6H', 12.0, 10.106, 9.853, 1.75), 'mm',
+     {'pitch_max': 11.063, 'minor_max': 10.441}),
+    (('6g', 12.0, 10.106, 9.853, 1.75), 'mm',
+     {'major_min': 11.701, 'pitch_min': 10.679, 'pitch_max': 10.829}),
+    (('6H', 16.0, 13.835, 13.546, 2.0), 'mm',
+     {'pitch_max': 14.913, 'minor_max': 14.21}),
+    (('6g', 16.0, 13.835, 13.546, 2.0), 'mm',
+     {'major_min': 15.682, 'pitch_min': 14.503, 'pitch_max': 14.663}),
+    (('6H', 20.0, 17.294, 16.933, 2.5), 'mm',
+     {'pitch_max': 18.6, 'minor_max': 17.744}),
+    (('6g', 20.0, 17.294, 16.933, 2.5), 'mm',
+     {'major_min': 19.623, 'pitch_min': 18.164, 'pitch_max': 18.334}),
+    (('2B', 6.35, 4.978, 4.826, 1.27), 'in',
+     {'pitch_min': 0.2175, 'pitch_max': 0.2224}),
+    (('3B', 6.35, 4.978, 4.826, 1.27), 'in',
+     {'pitch_max': 0.2211}),
+    (('1B', 6.35, 4.978, 4.826, 1.27), 'in',
+     {'pitch_max': 0.2248}),
+    (('2A', 6.35, 4.978, 4.826, 1.27), 'in',
+     {'major_min': 0.2408, 'major_max': 0.2489,
+      'pitch_min': 0.2127, 'pitch_max': 0.2164}),
+    (('2A', 12.7, 10.592, 10.358, 25.4 / 13), 'in',
+     {'major_max': 0.4985, 'pitch_min': 0.4435, 'pitch_max': 0.4485}),
+)
+
+# (generation, {(designation, tolerance): ThreadLimits or None})
+_cache = None
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | ISO 965-1                                              |
+# |                                                        |
+# +--------------------------------------------------------+
+def _r40(x):
+    """
+    _r40(x) -> nearest R40 preferred number [um]. Internal function.
+    """
+    n = int(round(40.0 * math.log10(x)))
+    return _R40[n % 40] * 10.0**(n // 40 - 2)
+
+def _isoTable(table, P):
+    """
+    _isoTable(table, P) -> row of the ISO 965-1 table or None.
+    Internal function.
+    """
+    return table.get(round(P, 2))
+
+def _isoRangeMean(D):
+    """
+    _isoRangeMean(D) -> geometric mean of the diameter range of D.
+    Internal function.
+    """
+    for i in range(1, len(_ISO_RANGES)):
+        if D <= _ISO_RANGES[i]:
+            return math.sqrt(_ISO_RANGES[i-1] * _ISO_RANGES[i])
+    return D
+
+def _isoDeviation(position, P):
+    """
+    _isoDeviation(position, P) -> fundamental deviation [um] or None.
+    Internal function.
+    """
+    if position in 'Hh':
+        return 0.0
+    row = _isoTable(_ISO_DEVIATIONS, P)
+    if row is None:
+        return float(round(_ISO_DEVIATION[position](P)))
+    return row[_ISO_POSITIONS.index(position)]
+
+def _isoGraded(table, grades, grade, P, formula):
+    """
+    _isoGraded(table, grades, grade, P, formula) -> tolerance [um] or None
+
+    Internal function. Tolerance of the grade from the table, pitches
+    out of the table from formula (grade 6) rounded to R40.
+    """
+    if grade not in grades:
+        return None
+    row = _isoTable(table, P)
+    if row is not None:
+        return row[grades.index(grade)]
+    base = _r40(formula(P))
+    return base if grade == 6 else _r40(_ISO_GRADE[grade] * base)
+
+def _TD1(P):
+    """
+    _TD1(P) -> ISO 965-1 formula of TD1 grade 6 [um]. Internal function.
+    """
+    if P < 1.0:
+        return 433.0 * P - 190.0 * P**1.22
+    return 230.0 * P**0.7
+
+def _Td(P):
+    """
+    _Td(P) -> ISO 965-1 formula of Td grade 6 [um]. Internal function.
+    """
+    return 180.0 * P**(2.0/3.0) - 3.15 / math.sqrt(P)
+
+def _isoLimits(tolerance, D, D1, d3, P):
+    """
+    _isoLimits(tolerance, D, D1, d3, P) -> ThreadLimits or None
+
+    Internal function. tolerance is already checked by _RE_ISO.
+    """
+    m = _RE_ISO.match(tolerance)
+    grade = int(m.group(1))
+    position = m.group(2)
+    if m.group(3) is None:
+        grade2, position2 = grade, position
+    else:
+        grade2, position2 = int(m.group(3)), m.group(4)
+    internal = position.isupper()
+    if position2.isupper() != internal:
+        return None
+    D2 = round(D - _D2_FACTOR * P, 3)
+    # grade 6 of the external thread, the base of all pitch tolerances
+    Td2_6 = _r40(90.0 * P**0.4 * _isoRangeMean(D)**0.1)
+    # deviation of the second class is used for the major / minor diameter
+    dev = _isoDeviation(position, P)
+    dev2 = _isoDeviation(position2, P)
+    if (dev is None) or (dev2 is None):
+        return None
+    dev, dev2 = 0.001 * dev, 0.001 * dev2
+    if internal:
+        if grade not in _ISO_GRADE_TD2:
+            return None
+        TD1 = _isoGraded(_ISO_TD1, _ISO_GRADES_TD1, grade2, P, _TD1)
+        if TD1 is None:
+            return None
+        TD2 = 0.001 * _r40(_ISO_GRADE_TD2[grade] * Td2_6)
+        TD1 = 0.001 * TD1
+        return ThreadLimits(tolerance, True,
+                            round(D + dev, 3), round(D + dev + TD2, 3),
+                            round(D2 + dev, 3), round(D2 + dev + TD2, 3),
+                            round(D1 + dev2, 3), round(D1 + dev2 + TD1, 3))
+    if grade not in _ISO_GRADE_Td2:
+        return None
+    Td = _isoGraded(_ISO_TD, _ISO_GRADES_Td, grade2, P, _Td)
+    if Td is None:
+        return None
+    Td2 = 0.001 * (Td2_6 if grade == 6 else _r40(_ISO_GRADE_Td2[grade] * Td2_6))
+    Td = 0.001 * Td
+    return ThreadLimits(tolerance, False,
+                        round(D + dev2 - Td, 3), round(D + dev2, 3),
+                        round(D2 + dev - Td2, 3), round(D2 + dev, 3),
+                        round(d3 + dev - Td2, 3), round(d3 + dev, 3))
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | ASME B1.1                                              |
+# |                                                        |
+# +--------------------------------------------------------+
+def _inch(x):
+    """
+    _inch(x) -> x rounded to 0.0001 inch as ASME B1.1 tables.
+    Internal function.
+    """
+    return round(x, 4)
+
+def _asmeLimits(tolerance, D, D1, d3, P):
+    """
+    _asmeLimits(tolerance, D, D1, d3, P) -> ThreadLimits or None
+
+    Internal function. tolerance is already checked by _RE_ASME.
+    Limits are calculated in inches rounded to 0.0001 in, D, D1, d3 and
+    P are in mm.
+    """
+    Di = D / 25.4
+    Pi = P / 25.4
+    LE = Di # length of engagement - basic major diameter
+    Td2_2A = 0.0015 * Di**(1.0/3.0) + 0.0015 * math.sqrt(LE) + 0.015 * Pi**(2.0/3.0)
+    Td2_2A = round(Td2_2A, 6) # class factors apply to 6 decimal places
+    Td2 = _inch(Td2_2A * _ASME_FACTOR[tolerance])
+    D2 = _inch(Di - _D2_FACTOR * Pi)
+    if tolerance.endswith('B'):
+        # internal thread, no allowance
+        D1i = _inch(D1 / 25.4)
+        if tolerance == '3B':
+            TD1 = 0.05 * Pi**(2.0/3.0) + 0.03 * Pi / Di - 0.002
+            TD1 = min(max(TD1, 0.23 * Pi - 1.5 * Pi**2), 0.394 * Pi)
+        elif Pi >= 0.25: # 4 TPI and coarser
+            TD1 = 0.15 * Pi
+        else:
+            TD1 = 0.25 * Pi - 0.4 * Pi**2
+        TD1 = _inch(TD1)
+        return ThreadLimits(tolerance, True,
+                            round(25.4 * Di, 3), round(25.4 * (Di + Td2), 3),
+                            round(25.4 * D2, 3), round(25.4 * (D2 + Td2), 3),
+                            round(25.4 * D1i, 3), round(25.4 * (D1i + TD1), 3))
+    # external thread, allowance for classes 1A and 2A
+    es = 0.0 if tolerance == '3A' else -_inch(0.3 * Td2_2A)
+    if tolerance == '1A':
+        Td = _inch(0.090 * Pi**(2.0/3.0))
+    else:
+        Td = _inch(0.060 * Pi**(2.0/3.0))
+    d3i = _inch(d3 / 25.4)
+    return ThreadLimits(tolerance, False,
+                        round(25.4 * (Di + es - Td), 3), round(25.4 * (Di + es), 3),
+                        round(25.4 * (D2 + es - Td2), 3), round(25.4 * (D2 + es), 3),
+                        round(25.4 * (d3i + es - Td2), 3), round(25.4 * (d3i + es), 3))
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | calcLimits() - limits of any thread                    |
+# |                                                        |
+# +--------------------------------------------------------+
+def normalizeTolerance(tolerance):
+    """
+    normalizeTolerance(tolerance) -> string
+
+    '-6g ' -> '6g', '2a' -> '2A'. Letter case is significant for ISO
+    classes (H internal, g external), so it is kept for them.
+    """
+    tolerance = ''.join(tolerance.split()).lstrip('-')
+    if _RE_ASME.match(tolerance.upper()):
+        return tolerance.upper()
+    return tolerance
+
+def toleranceSystem(tolerance):
+    """
+    toleranceSystem(tolerance) -> 'ISO', 'ASME' or None
+
+    Standard of the (normalized) tolerance class.
+    """
+    if _RE_ISO.match(tolerance):
+        return 'ISO'
+    if _RE_ASME.match(tolerance):
+        return 'ASME'
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def calcLimits(tolerance, D, D1, d3, pitch):
+    """
+    calcLimits(tolerance, D, D1, d3, pitch) -> ThreadLimits or None
+
+    Limit diameters of the thread with basic diameters D, D1, d3 and pitch
+    [mm]. The tolerance class selects the standard and internal/external
+    thread. Returns None for unknown tolerance class or zero pitch.
+    Memoized.
+    """
+    tolerance = normalizeTolerance(tolerance)
+    if (pitch <= 0.0) or (D <= 0.0):
+        return None
+    system = toleranceSystem(tolerance)
+    if system == 'ISO':
+        return _isoLimits(tolerance, D, D1, d3, pitch)
+    if system == 'ASME':
+        return _asmeLimits(tolerance, D, D1, d3, pitch)
+    return None
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | getLimits() - limits of catalog threads                |
+# |                                                        |
+# +--------------------------------------------------------+
+def _getCache():
+    """
+    _getCache() -> dictionary (designation, tolerance) -> limits
+
+    Internal function. The cache is dropped when catalogs are changed.
+    """
+    global _cache
+    generation = ct3d_catalog.getGeneration()
+    if (_cache is None) or (_cache[0] != generation):
+        _cache = (generation, {})
+    return _cache[1]
+
+def _familyAccepts(family, tolerance):
+    """
+    _familyAccepts(family, tolerance) -> bool
+
+    Internal function. ISO classes apply to metric catalogs, ASME classes
+    to unified ones only.
+    """
+    system = toleranceSystem(tolerance)
+    lthr = ct3d_catalog.getCatalog(family)
+    if system == 'ISO':
+        return isinstance(lthr, ct3d_catalog.MetricThreadCatalog)
+    if system == 'ASME':
+        return isinstance(lthr, ct3d_catalog.UnifiedThreadCatalog)
+    return False
+
+def _recordLimits(rec, tolerance):
+    """
+    _recordLimits(rec, tolerance) -> ThreadLimits or None
+
+    Internal function. Limits of the catalog record, None if the
+    tolerance class does not fit its family.
+    """
+    if not _familyAccepts(rec.family, tolerance):
+        return None
+    return calcLimits(tolerance, float(rec.D), float(rec.D1),
+                      float(rec.d3), float(rec.pitch))
+
+def getLimits(designation, tolerance):
+    """
+    getLimits(designation, tolerance) -> ThreadLimits or None
+
+    Limit diameters of the catalog thread, e.g. getLimits('M10', '6H'),
+    getLimits('1/4"-20 UNC', '2A'). The designation is resolved by
+    ct3d_designation.parseDesignation(). Returns None if the designation
+    is not in catalogs or the tolerance class does not fit the thread.
+    Cached by (designation, tolerance).
+    """
+    cache = _getCache()
+    key = (designation, tolerance)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    try:
+        rec = ct3d_designation.parseDesignation(designation)
+    except ct3d_designation.DesignationError:
+        rslt = None
+    else:
+        rslt = _recordLimits(rec, normalizeTolerance(tolerance))
+    cache[key] = rslt
+    return rslt
+
+def getFamilyLimits(family, tolerance):
+    """
+    getFamilyLimits(family, tolerance) -> list of (name, ThreadLimits or None)
+
+    Limits of all threads of the family in catalog order. All of them are
+    precomputed into the getLimits() cache.
+    """
+    cache = _getCache()
+    tolerance_n = normalizeTolerance(tolerance)
+    lthr = ct3d_catalog.getCatalog(family)
+    rslt = []
+    i = 0
+    rec = lthr.getRecordByIndex(i)
+    while rec is not None:
+        key = (rec.name, tolerance)
+        if key not in cache:
+            cache[key] = _recordLimits(rec, tolerance_n)
+        rslt.append((rec.name, cache[key]))
+        i += 1
+        rec = lthr.getRecordByIndex(i)
+    return rslt
+
+def getThreadLimits(designation, tolerance, D, D1, d3, pitch):
+    """
+    getThreadLimits(designation, tolerance, D, D1, d3, pitch) -> ThreadLimits or None
+
+    Limits of a thread feature. Catalog limits (getLimits() cache) are used
+    if the designation is a catalog thread with the same diameters and
+    pitch, the limits are calculated from the diameters otherwise (user
+    edited values) - the tolerance class has to fit the family of the
+    designation still.
+    """
+    try:
+        rec = ct3d_designation.parseDesignation(designation)
+    except ct3d_designation.DesignationError:
+        rec = None
+    if (rec is not None) and \
+       (abs(rec.D - D) < 1e-6) and (abs(rec.pitch - pitch) < 1e-6) and \
+       (abs(rec.D1 - D1) < 1e-6 or abs(rec.d3 - d3) < 1e-6):
+        return getLimits(designation, tolerance)
+    tolerance = normalizeTolerance(tolerance)
+    if (rec is not None) and not _familyAccepts(rec.family, tolerance):
+        return None
+    return calcLimits(tolerance, D, D1, d3, pitch)
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | checkPublished() - spot checks                         |
+# |                                                        |
+# +--------------------------------------------------------+
+def checkPublished():
+    """
+    checkPublished() -> list of (tolerance, D, field, calculated, published)
+
+    Compare calculated limits with the PUBLISHED values of the standard
+    tables, returns the differences (empty list - all values match).
+    """
+    rslt = []
+    for args, unit, values in PUBLISHED:
+        lim = calcLimits(*args)
+        for field, value in values.items():
+            calc = None if lim is None else getattr(lim, field)
+            if (calc is not None) and (unit == 'in'):
+                calc = round(calc / 25.4, 4)
+            if (calc is None) or (abs(calc - value) > 1e-9):
+                rslt.append((args[0], args[1], field, calc, value))
+    return rslt
+
+if __name__ == '__main__':
+    # python ct3d_tolerance.py - spot checks of the limits
+    errors = checkPublished()
+    for err in errors:
+        print('%s D=%g %s: calculated %s, published %s' % err)
+    assert not errors, 'limits differ from the published values'
+    print('%d published threads match' % len(PUBLISHED))
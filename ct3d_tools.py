@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_tools.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Tools for GUI of Cosmetic Tread 3D which do not need FreeCAD - filling
+of thread parameters from catalogs and the best fitting thread.
+They are used by ct3dGuiTools (and imported from there) and they can be
+used and measured without FreeCAD (see benchmarks/ct3d_bench.py).
+"""
+
+import ct3d_catalog
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+
+# /***********************************************************************/
+# /                                                                       /
+# / threadIFromDobj() - Estimate best fitting thread name/counter 'i'     /
+# /     from Dobj and list of threads                                     /
+# /                                                                       /
+# /***********************************************************************/
+def threadIFromDobj(Dobj, obj, lthr):
+    """
+    threadIFromDobj(Dobj, obj, list_of_thread_class) -> int
+
+    Estimate the best fitting thread index from Dobj and list_of_thread_class.
+    Internal threads are compared by D_drill, external threads by D.
+    Returns int >= 0
+    """
+    CurrentIndex = 0
+    if hasattr(obj, 'D1'):  # internal thread
+        CurrentIndex = lthr.getNearestIndex(Dobj, True)
+    elif hasattr(obj, 'd3'):  # external thread
+        CurrentIndex = lthr.getNearestIndex(Dobj, False)
+    return CurrentIndex
+
+
+
+# /***********************************************************************/
+# /                                                                       /
+# / fillParamsI()                                                         /
+# /                                                                       /
+# /***********************************************************************/
+def fillParamsI (ct3d_prms, thrName, lst_threads):
+    """
+    fillParamsI (ct3d_prms, thrName, lst_threads) -> None
+
+    Fill ct3d params from lst_threads according to thrName.
+    Internal thread version.
+    """
+    rec = lst_threads.getRecord(thrName)
+    if rec is None:
+        rec = ct3d_catalog.NO_RECORD
+    ct3d_prms.name = thrName
+    ct3d_prms.D_nominal = rec.D_nominal
+    ct3d_prms.pitch = rec.pitch
+    ct3d_prms.TPI = rec.TPI
+    ct3d_prms.D = rec.D
+    ct3d_prms.D1 = rec.D1
+    # ct3d_prms.d3 = rec.d3 # internal thread
+    # # doesn't have this parameter
+    ct3d_prms.D_drill = rec.D_drill
+    ct3d_prms.tolerance = '6H'
+    ct3d_prms.roughness = 'Ra 1.6'
+    ct3d_prms.length = round(1.5 * ct3d_prms.D_nominal, 1)
+    ct3d_prms.length_through = False
+    ct3d_prms.length_tol = "H17"
+
+
+
+# /***********************************************************************/
+# /                                                                       /
+# / fillParamsE()                                                         /
+# /                                                                       /
+# /***********************************************************************/
+def fillParamsE (ct3d_prms, thrName, lst_threads):
+    """
+    fillParamsE (ct3d_prms, thrName, lst_threads) -> None
+
+    Fill ct3d params from lst_threads according to thrName.
+    External thread version.
+    """
+    rec = lst_threads.getRecord(thrName)
+    if rec is None:
+        rec = ct3d_catalog.NO_RECORD
+    ct3d_prms.name = thrName
+    ct3d_prms.D_nominal = rec.D_nominal
+    ct3d_prms.pitch = rec.pitch
+    ct3d_prms.TPI = rec.TPI
+    ct3d_prms.D = rec.D
+    # ct3d_prms.D1 = rec.D1 # external thread
+    # # doesn't have this parameter
+    ct3d_prms.d3 = rec.d3
+    # ct3d_prms.D_drill = rec.D_drill # external thread
+    # # doesn't have this parameter
+    ct3d_prms.tolerance = '6g'
+    ct3d_prms.roughness = 'Ra 1.6'
+    ct3d_prms.length = round(1.5 * ct3d_prms.D_nominal, 1)
+    ct3d_prms.length_through = False
+    ct3d_prms.length_tol = "H17"
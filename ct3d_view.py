@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# ct3d_view.py
+#
+#******************************************************************************
+#* Cosmetic Thread 3D Work Bench - tools for cosmetic threads creation        *
+#* Copyright (C) 2024  Martin Prokš / martin(dot)proks(at)proks-martin(dot)cz *
+#*                                                                            *
+#* This file is part of the FreeCAD CAx development system.                   *
+#*                                                                            *
+#* This library is free software; you can redistribute it and/or              *
+#* modify it under the terms of the GNU Lesser General Public                 *
+#* License as published by the Free Software Foundation; either               *
+#* version 2.1 of the License, or (at your option) any later version.         *
+#*                                                                            *
+#* This library is distributed in the hope that it will be useful,            *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of             *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU          *
+#* Lesser General Public License for more details.                            *
+#*                                                                            *
+#* You should have received a copy of the GNU Lesser General Public           *
+#* License along with this library; if not, write to the Free Software        *
+#* Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  *
+#* USA                                                                        *
+#******************************************************************************
+"""
+Lightweight display of the cosmetic threads - the view providers draw
+the helix and the circles as Coin line sets made from the thread
+properties. The feature has an empty shape (see ct3d_geometry), there
+is no BREP construction nor its tessellation.
+
+Display mode 'Lightweight' is used by features with the property
+lightweight set, the view provider switches to it. The mode used before
+is kept (and saved with the view provider) and it comes back when
+lightweight is reset.
+"""
+
+from pivy import coin
+import ct3d_geometry
+
+__title__ = 'Cosmetic Thread 3D Work Bench'
+__author__ = 'Martin Prokš'
+__License__ = 'LGPL-2.1-or-later'
+__url__ = 'https://github.com/martinproks/cosmeticthread3d'
+
+
+# display mode of the lightweight threads
+LIGHTWEIGHT = 'Lightweight'
+# display mode of the threads with shape
+DEFAULT_MODE = 'Wireframe'
+# line pattern of the dashed draw style
+DASHED = 0x0f0f
+
+
+
+# +--------------------------------------------------------+
+# |                                                        |
+# | ThreadLines - Coin scene of the lightweight display    |
+# |                                                        |
+# +--------------------------------------------------------+
+class ThreadLines:
+    """
+    Coin line set of one thread for the display mode 'Lightweight'.
+    Created in attach() of the view provider, it is not saved.
+    """
+
+    def __init__(self, vobj, internal):
+        """
+        __init__(vobj, internal)
+
+        Add the display mode into the view object vobj of internal or
+        external thread.
+        """
+        self.internal = internal
+        self.lines = None # (points, counts) shown
+        self.previousMode = None # display mode before LIGHTWEIGHT
+        self.color = coin.SoBaseColor()
+        self.style = coin.SoDrawStyle()
+        self.style.style = coin.SoDrawStyle.LINES
+        self.coords = coin.SoCoordinate3()
+        self.lineSet = coin.SoLineSet()
+        root = coin.SoSeparator()
+        root.addChild(self.color)
+        root.addChild(self.style)
+        root.addChild(self.coords)
+        root.addChild(self.lineSet)
+        vobj.addDisplayMode(root, LIGHTWEIGHT)
+        self.setStyle(vobj)
+
+    def setStyle(self, vobj):
+        """
+        setStyle(vobj)
+
+        Line color, width and style from the view object properties.
+        """
+        if hasattr(vobj, 'LineColor'):
+            self.color.rgb.setValue(*vobj.LineColor[:3])
+        if hasattr(vobj, 'LineWidth'):
+            self.style.lineWidth = vobj.LineWidth
+        if getattr(vobj, 'DrawStyle', '') == 'Dashed':
+            self.style.linePattern = DASHED
+        else:
+            self.style.linePattern = 0xffff
+
+    def update(self, fp):
+        """
+        update(fp)
+
+        New lines of the lightweight feature fp, if they changed.
+        """
+        if not getattr(fp, 'lightweight', False):
+            return
+        if self.internal:
+            lines = ct3d_geometry.internalLines(fp)
+        else:
+            lines = ct3d_geometry.externalLines(fp)
+        if lines is self.lines:
+            return
+        points, counts = lines
+        self.coords.point.setValues(0, len(points), points)
+        self.coords.point.setNum(len(points))
+        self.lineSet.numVertices.setValues(0, len(counts), counts)
+        self.lineSet.numVertices.setNum(len(counts))
+        self.lines = lines
+
+    def updateData(self, fp, prop):
+        """
+        updateData(fp, prop)
+
+        Handle change of the feature property prop - switch the display
+        mode by lightweight, new lines after recompute.
+        """
+        if prop == 'lightweight':
+            vobj = fp.ViewObject
+            if fp.lightweight:
+                if vobj.DisplayMode != LIGHTWEIGHT:
+                    self.previousMode = vobj.DisplayMode
+                    vobj.DisplayMode = LIGHTWEIGHT
+            elif vobj.DisplayMode == LIGHTWEIGHT:
+                vobj.DisplayMode = self.previousMode or DEFAULT_MODE
+                self.previousMode = None
+            self.update(fp)
+        elif prop == 'Shape':
+            self.update(fp)
+
+    def dumps(self):
+        """
+        dumps() -> state for the view provider dumps(), None if there is
+        nothing to save.
+        """
+        if self.previousMode is None:
+            return None
+        return {'previousMode': self.previousMode}
+
+    def loads(self, state):
+        """
+        loads(state)
+
+        Restore the state made by dumps().
+        """
+        if isinstance(state, dict):
+            self.previousMode = state.get('previousMode')